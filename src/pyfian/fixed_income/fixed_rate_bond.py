@@ -623,7 +623,7 @@ class FixedRateBullet(BaseFixedIncomeInstrumentWithYieldToMaturity):
         --------
         >>> bond = FixedRateBullet('2020-01-01', '2025-01-01', 5, 1)
         >>> bond.yield_to_maturity(price=95)
-        np.float64(0.06100197251858131)
+        np.float64(0.061001972518...)
         """
         if tol is None:
             tol = 1e-6
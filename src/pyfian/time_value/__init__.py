@@ -17,6 +17,7 @@ from pyfian.time_value.interest_income import (
 )
 from pyfian.time_value.irr import (
     irr,
+    irr_batch,
     np_irr,
     npv,
     xirr,
@@ -31,16 +32,21 @@ from pyfian.time_value.means import (
     weighted_harmonic_mean,
 )
 from pyfian.time_value.mortgage import (
+    amortization_balances,
     calculate_payment,
+    calculate_payments,
     generate_amortization_schedule,
     mortgage_cash_flows,
 )
 from pyfian.time_value.present_value import (
     present_value_annuity,
     present_value_annuity_annual,
+    present_value_annuity_batch,
     present_value_growing_annuity,
     present_value_growing_perpetuity,
+    present_value_growing_perpetuity_batch,
     present_value_two_stage_annuity,
+    present_value_two_stage_annuity_batch,
     present_value_two_stage_annuity_perpetuity,
 )
 from pyfian.time_value.rate_conversions import (
@@ -50,6 +56,7 @@ from pyfian.time_value.rate_conversions import (
     continuous_to_effective,
     convert_effective_to_mmr,
     convert_yield,
+    convert_yield_batch,
     effective_annual_to_bey,
     effective_to_continuous,
     effective_to_money_market_rate,
@@ -83,6 +90,7 @@ __all__ = [
     "interest_income_nominal_periods",
     # irr
     "irr",
+    "irr_batch",
     "np_irr",
     "npv",
     "xirr",
@@ -95,15 +103,20 @@ __all__ = [
     "weighted_geometric_mean",
     "weighted_harmonic_mean",
     # mortgage
+    "amortization_balances",
     "calculate_payment",
+    "calculate_payments",
     "generate_amortization_schedule",
     "mortgage_cash_flows",
     # present_value
     "present_value_annuity",
     "present_value_annuity_annual",
+    "present_value_annuity_batch",
     "present_value_growing_annuity",
     "present_value_growing_perpetuity",
+    "present_value_growing_perpetuity_batch",
     "present_value_two_stage_annuity",
+    "present_value_two_stage_annuity_batch",
     "present_value_two_stage_annuity_perpetuity",
     # rate_conversions
     "VALID_YIELD_CALCULATION_CONVENTIONS",
@@ -112,6 +125,7 @@ __all__ = [
     "continuous_to_effective",
     "convert_effective_to_mmr",
     "convert_yield",
+    "convert_yield_batch",
     "effective_annual_to_bey",
     "effective_to_continuous",
     "effective_to_money_market_rate",
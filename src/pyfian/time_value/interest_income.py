@@ -15,6 +15,10 @@ This module provides functions to calculate expected interest income for a given
 
 All calculations are per dollar by default, but the principal (notional) can be customized.
 
+Every argument may also be a NumPy array (or pandas Series); the formulas broadcast
+element-wise, so the income for many positions is computed in a single vectorized call
+instead of a Python loop.
+
 Formulas
 --------
 
@@ -40,17 +44,19 @@ Where:
 Examples
 --------
 >>> interest_income_continuous(0.05, 1)
-np.float64(0.05127109637602412)
+np.float64(0.05127109637602...)
+>>> interest_income_nominal_periods(np.array([0.04, 0.06]), 12, 6)
+array([0.02, 0.03])
 >>> interest_income_effective(0.05, 1)
-0.05
+np.float64(0.05)
 >>> interest_income_nominal_periods(0.06, 12, 6)
 0.03
 >>> interest_income_nominal_days(0.06, 30, 360)
-0.005
+0.00499...
 >>> interest_income_money_market_discount(0.06, 180)
 0.03
 >>> interest_income_money_market_addon_notional(0.06, 180)
-0.02912621359223301
+0.0291262135922...
 >>> interest_income_money_market_addon_investment(0.06, 180)
 0.03
 >>> interest_income_bey(0.06, 2)
@@ -96,9 +102,9 @@ def interest_income_continuous(
     Examples
     --------
     >>> interest_income_continuous(0.05, 1)
-    np.float64(0.05127109637602412)
+    np.float64(0.05127109637602...)
     """
-    return notional * (np.exp(rate * time) - 1)
+    return notional * np.expm1(rate * time)
 
 
 def interest_income_effective(
@@ -135,9 +141,9 @@ def interest_income_effective(
     Examples
     --------
     >>> interest_income_effective(0.05, 1)
-    0.05
+    np.float64(0.05)
     """
-    return round(notional * ((1 + effective_rate) ** time - 1), 10)
+    return notional * np.expm1(time * np.log1p(effective_rate))
 
 
 def interest_income_nominal_periods(
@@ -226,10 +232,10 @@ def interest_income_nominal_days(
     Examples
     --------
     >>> interest_income_nominal_days(0.06, 30, 360)
-    0.005
+    0.00499...
     """
     # Calculate interest income directly from nominal rate and compounding for custom period
-    return round(notional * nominal_rate * (days / base_year), 10)
+    return notional * nominal_rate * (days / base_year)
 
 
 def interest_income_money_market_discount(
@@ -312,10 +318,10 @@ def interest_income_money_market_addon_notional(
     Examples
     --------
     >>> interest_income_money_market_addon_notional(0.06, 180)
-    0.02912621359223301
+    0.0291262135922...
     """
-    investment = notional / (1 + mmr * (mmr_days / base))
-    return investment * mmr * (mmr_days / base)
+    period_rate = mmr * (mmr_days / base)
+    return notional * period_rate / (1 + period_rate)
 
 
 def interest_income_money_market_addon_investment(
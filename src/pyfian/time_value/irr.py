@@ -7,12 +7,16 @@ Module for computing the Internal Rate of Return (IRR) from a series of cash flo
 from __future__ import annotations
 
 
+import math
 from collections.abc import Sequence
 from datetime import datetime
 
-import numpy_financial as npf
+import numpy as np
 import pandas as pd
-from scipy.optimize import newton
+from scipy.optimize import brentq, newton
+
+# Candidate rates scanned by ``xirr_base`` to bracket a root for Brent's method.
+_XIRR_BRACKET_RATES = np.array([-0.9, -0.5, 0.0, 0.1, 0.5, 1.0, 5.0, 20.0])
 
 
 def npv(rate: float, cash_flows: list[float]) -> float:
@@ -48,14 +52,32 @@ def npv(rate: float, cash_flows: list[float]) -> float:
     >>> npv(0.1, [-100, 50, 60])
     -4.958677686
     """
-    return round(sum(cf / (1 + rate) ** t for t, cf in enumerate(cash_flows)), 10)
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    return round(float(cf @ _discount_factors(rate, cf.size)), 10)
+
+
+def _discount_factors(rate: float, n: int, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Return the discount factors :math:`(1 + r)^{-t}` for :math:`t = 0, \\dots, n - 1`.
+
+    The factors are built as a running product of :math:`v = 1 / (1 + r)`, so
+    only one division is needed regardless of `n`. If `out` is given, it must
+    have length `n` and is filled in place, which lets iterative solvers reuse a
+    single buffer across iterations.
+    """
+    if out is None:
+        out = np.empty(n)
+    out.fill(1 / (1 + rate))
+    if n:
+        out[0] = 1.0
+    return np.cumprod(out, out=out)
 
 
 def irr(
     cash_flows: list[float], guess: float = 0.1, tol: float = 1e-6, max_iter: int = 1000
 ) -> float:
     """
-    Estimate the Internal Rate of Return (IRR) using the Newton-Raphson method.
+    Estimate the Internal Rate of Return (IRR) using Halley's method.
 
     The IRR is the rate that makes the NPV of cash flows equal to zero. The formula is:
 
@@ -65,7 +87,13 @@ def irr(
         - :math:`IRR` is the internal rate of return
         - :math:`CF_t` is the cash flow at time `t`
         - :math:`n` is the total number of periods
-    This function uses the Newton-Raphson method to find the IRR iteratively.
+    This function uses Halley's method, which also uses the second derivative of
+    the NPV and converges cubically, to find the IRR iteratively. The NPV and both
+    derivatives share one table of discount factors per iteration. If Halley's
+    denominator vanishes, a Newton-Raphson step is taken instead.
+    Bond-like flows (a negative price followed by level coupons and a final
+    coupon plus face value) are recognized and solved from the closed-form bond
+    price instead.
     Convergence is determined by the specified tolerance and maximum iterations.
 
     Parameters
@@ -94,29 +122,173 @@ def irr(
     >>> irr([-1000, 300, 400, 500, 600])
     0.24888...
     """
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    if _is_bullet(cf):
+        price, coupon, face = -float(cf[0]), float(cf[1]), float(cf[-1] - cf[1])
+        return _irr_bullet(price, coupon, face, cf.size - 1, tol, max_iter)
+    # t * CF_t and t * (t + 1) * CF_t are fixed across iterations; only the
+    # discount factors change.
+    t = np.arange(cf.size)
+    t_cf = t * cf
+    tt_cf = (t + 1) * t_cf
+    disc = np.empty_like(cf)
+    # Thresholds are compared against squares to avoid abs() in the loop
+    tol2 = tol * tol
+    eps2 = 1e-20
     rate = guess
     for _ in range(max_iter):
-        f = npv(rate, cash_flows)
-        f_prime = sum(
-            -t * cf / (1 + rate) ** (t + 1) for t, cf in enumerate(cash_flows)
-        )
-        if abs(f_prime) < 1e-10:
+        _discount_factors(rate, cf.size, out=disc)
+        v = 1 / (1 + rate)
+        f = cf @ disc
+        f_prime = -v * (t_cf @ disc)
+        f_second = v * v * (tt_cf @ disc)
+        f_prime2 = f_prime * f_prime
+        if f_prime2 < eps2:
             break
-        new_rate = rate - f / f_prime
-        if abs(new_rate - rate) < tol:
-            return new_rate
+        denominator = 2 * f_prime2 - f * f_second
+        if denominator * denominator < eps2:
+            new_rate = rate - f / f_prime
+        else:
+            new_rate = rate - 2 * f * f_prime / denominator
+        step = new_rate - rate
+        if step * step < tol2:
+            return float(new_rate)
         rate = new_rate
     raise ValueError("IRR calculation did not converge")
 
 
+def _is_bullet(cf: np.ndarray) -> bool:
+    """Check for bond-like flows: ``[-price, c, ..., c, c + face]`` with c, face > 0."""
+    return (
+        cf.size >= 3
+        and cf[0] < 0
+        and cf[1] > 0
+        and cf[-1] > cf[1]
+        and bool(np.all(cf[2:-1] == cf[1]))
+    )
+
+
+def _irr_bullet(
+    price: float, coupon: float, face: float, n: int, tol: float, max_iter: int
+) -> float:
+    """
+    IRR of a level-coupon bullet bond from its closed-form price.
+
+    Solves ``price = coupon * (1 - (1 + r)**-n) / r + face * (1 + r)**-n`` with
+    Brent's method. The right-hand side decreases monotonically in `r`, so the
+    root is unique. The search starts from a narrow bracket around the usual
+    approximate yield, ``(coupon + (face - price) / n) / ((face + price) / 2)``,
+    and widens it on either side by doubling steps until it contains the root;
+    the lower end never drops more than halfway toward -1 per step.
+    """
+
+    def f(rate: float) -> float:
+        log_v = -n * math.log1p(rate)
+        try:
+            if rate == 0:
+                annuity = n
+            else:
+                annuity = -math.expm1(log_v) / rate
+            return coupon * annuity + face * math.exp(log_v) - price
+        except OverflowError:
+            # Only reachable for rate < 0 on long series, where the price is
+            # unboundedly large; Brent's method bisects away from an infinite end
+            return math.inf
+
+    approx = max((coupon + (face - price) / n) / ((face + price) / 2), -0.5)
+    width = 0.005
+    lo, hi = max(approx - width, (approx - 1) / 2), approx + width
+    lo_width = width
+    while f(lo) < 0:
+        lo_width *= 2
+        lo = max(approx - lo_width, (lo - 1) / 2)
+    while f(hi) > 0:
+        width *= 2
+        hi = approx + width
+    try:
+        return brentq(f, lo, hi, xtol=tol * tol, maxiter=max_iter)
+    except RuntimeError:
+        raise ValueError("IRR calculation did not converge")
+
+
+def irr_batch(
+    cash_flows, guess: float = 0.1, tol: float = 1e-6, max_iter: int = 1000
+) -> np.ndarray:
+    """
+    Estimate the Internal Rate of Return (IRR) of many cash-flow series at once.
+
+    Each row of `cash_flows` is one series (e.g., one bond), with the column
+    index representing the time period. All rows are solved simultaneously with
+    the same Halley iteration as :func:`irr`, vectorized across rows, so the
+    cost of a portfolio is a handful of array operations per iteration rather
+    than one Python loop per instrument. Rows that have converged are dropped
+    from subsequent iterations.
+
+    Parameters
+    ----------
+    cash_flows : array-like of shape (n_series, n_periods)
+        Cash flow values, one series per row. Shorter series can be padded
+        with trailing zeros.
+    guess : float, optional
+        Initial guess for the IRR (default is 0.1, i.e. 10%).
+    tol : float, optional
+        Tolerance for convergence (default is 1e-6).
+    max_iter : int, optional
+        Maximum number of iterations (default is 1000).
+
+    Returns
+    -------
+    numpy.ndarray
+        Estimated internal rate of return of each row as a decimal. Rows for
+        which the calculation does not converge are NaN.
+
+    Examples
+    --------
+    >>> irr_batch([[-1000, 300, 400, 500, 600], [-100, 5, 5, 5, 105]])
+    array([0.24888..., 0.05...])
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    t = np.arange(cf.shape[1])
+    t_cf = t * cf
+    tt_cf = (t + 1) * t_cf
+    rates = np.full(cf.shape[0], guess, dtype=np.float64)
+    result = np.full(cf.shape[0], np.nan)
+    active = np.arange(cf.shape[0])
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            if not active.size:
+                break
+            rate = rates[active]
+            v = 1 / (1 + rate)
+            disc = np.empty((active.size, cf.shape[1]))
+            disc[:] = v[:, np.newaxis]
+            disc[:, 0] = 1.0
+            np.cumprod(disc, axis=1, out=disc)
+            f = np.einsum("ij,ij->i", cf[active], disc)
+            f_prime = -v * np.einsum("ij,ij->i", t_cf[active], disc)
+            f_second = v * v * np.einsum("ij,ij->i", tt_cf[active], disc)
+            denominator = 2 * f_prime * f_prime - f * f_second
+            new_rate = np.where(
+                np.abs(denominator) < 1e-10,
+                rate - f / f_prime,
+                rate - 2 * f * f_prime / denominator,
+            )
+            converged = np.abs(new_rate - rate) < tol
+            result[active[converged]] = new_rate[converged]
+            keep = ~converged & (np.abs(f_prime) >= 1e-10) & np.isfinite(new_rate)
+            active = active[keep]
+            rates[active] = new_rate[keep]
+    return result
+
+
 def np_irr(cash_flows: list[float]) -> float:
     """
-    Compute the Internal Rate of Return using numpy-financial's IRR function.
+    Compute the Internal Rate of Return from the roots of the NPV polynomial.
 
-    This function is a wrapper around numpy-financial's `irr` function,
-    which calculates the IRR for a series of cash flows. It is useful for quickly
-    obtaining the IRR without manually implementing the calculation.
-    The IRR is the rate that makes the NPV of cash flows equal to zero. The formula is:
+    Writing :math:`x = 1 / (1 + IRR)`, the NPV equation becomes a polynomial in
+    :math:`x` whose roots are found with :func:`numpy.roots` (the eigenvalues of
+    its companion matrix). This solves for all candidate rates at once, without
+    an initial guess or iteration. The formula is:
 
     .. math::
         0 = \\sum_{t=0}^{n} \\frac{CF_t}{(1 + IRR)^t}
@@ -125,8 +297,12 @@ def np_irr(cash_flows: list[float]) -> float:
         - :math:`IRR` is the internal rate of return
         - :math:`CF_t` is the cash flow at time `t`
         - :math:`n` is the total number of periods
-    This function uses numpy-financial's built-in IRR calculation, which is efficient
-    and handles various edge cases.
+    Only real, positive roots :math:`x` are kept (an imaginary part below 1e-12
+    counts as real), i.e. rates above -100%. When several rates solve the
+    equation, the one with the smallest absolute value is returned, whatever
+    its sign. This can differ from the root numpy-financial's ``irr`` selects
+    for flows with several sign changes. If there is no solution, NaN is
+    returned.
 
     Parameters
     ----------
@@ -141,9 +317,14 @@ def np_irr(cash_flows: list[float]) -> float:
     Examples
     --------
     >>> np_irr([-1000, 300, 400, 500, 600])
-    0.2488833566240709
+    0.24888...
     """
-    return npf.irr(cash_flows)
+    roots = np.roots(np.asarray(cash_flows, dtype=np.float64)[::-1])
+    roots = roots[(np.abs(roots.imag) < 1e-12) & (roots.real > 0)].real
+    if not roots.size:
+        return np.nan
+    rates = 1 / roots - 1
+    return float(rates[np.argmin(np.abs(rates))])
 
 
 def xirr_base(
@@ -157,8 +338,10 @@ def xirr_base(
     Calculate the IRR (Yield) for non-periodic cash flows (XIRR).
 
     This function computes the IRR for a series of cash flows that occur at irregular intervals.
-    It uses the Newton-Raphson method to find the rate that makes the NPV
-    of the cash flows equal to zero.
+    The NPV is first evaluated on a small grid of candidate rates to find a sign
+    change, and the root is then located with Brent's method on that bracket, which
+    is guaranteed to converge. If no bracket is found, the Newton-Raphson method
+    (with the analytical derivative of the NPV) started at `guess` is used instead.
 
     The formula is:
 
@@ -197,18 +380,88 @@ def xirr_base(
     Examples
     --------
     >>> xirr_base([-1000, 300, 400, 500, 600], [0, 0.5, 1.0, 1.5, 2.0])
-    np.float64(0.5597096384526054)
+    np.float64(0.55970...)
+    """
+    return _solve_xirr(_CashFlows(cash_flows, times), guess, tol, max_iter)
+
+
+class _CashFlows:
+    """
+    Cash flows and their times in years, stored as two contiguous float64 arrays.
+
+    Inputs are converted once at the public-function boundary so the solver
+    only ever works on the raw arrays.
     """
 
-    def npv_xirr(rate: float) -> float:
-        return sum(cf / (1 + rate) ** t for cf, t in zip(cash_flows, times))
+    __slots__ = ("amounts", "times")
+
+    def __init__(self, amounts, times):
+        self.amounts = np.ascontiguousarray(amounts, dtype=np.float64)
+        self.times = np.ascontiguousarray(times, dtype=np.float64)
+        if self.amounts.shape != self.times.shape:
+            raise ValueError("cash_flows and times must have the same length")
+
+    @classmethod
+    def from_dates(cls, amounts, dates) -> _CashFlows:
+        """
+        Build from dates, measuring time in whole days/365 from the first date.
+
+        Day counts are floored at the dates' own resolution, like
+        :attr:`datetime.timedelta.days`, so times of day never round up.
+        """
+        dates = _to_datetime64(dates)
+        days = (dates - dates[0]) // np.timedelta64(1, "D")
+        return cls(amounts, days / 365.0)
+
+    def npv(self, rate: float) -> float:
+        return float(self.amounts @ np.power(1.0 + rate, -self.times))
+
+    def npv_derivative(self, rate: float) -> float:
+        return -float(
+            (self.amounts * self.times) @ np.power(1.0 + rate, -self.times - 1)
+        )
 
+
+def _solve_xirr(flows: _CashFlows, guess: float, tol: float, max_iter: int) -> float:
+    """Find the rate at which the NPV of `flows` is zero (see :func:`xirr_base`)."""
+    bracket = _find_bracket(flows.npv, guess)
     try:
-        result = newton(npv_xirr, guess, tol=tol, maxiter=max_iter)
+        if bracket is not None:
+            # Newton stops once a step is below tol, leaving an error of order
+            # tol**2; ask Brent for the same accuracy.
+            result = brentq(flows.npv, *bracket, xtol=tol * tol, maxiter=max_iter)
+            return np.float64(result)
+        return newton(
+            flows.npv,
+            guess,
+            fprime=flows.npv_derivative,
+            tol=tol,
+            maxiter=max_iter,
+        )
     except RuntimeError:
         raise ValueError("XIRR calculation did not converge")
 
-    return result
+
+def _find_bracket(func, guess: float) -> tuple[float, float] | None:
+    """
+    Find an interval of rates on which `func` changes sign.
+
+    `func` is evaluated at ``_XIRR_BRACKET_RATES`` plus `guess`. Among the
+    adjacent pairs with a sign change, the one closest to `guess` is returned,
+    so that the root found is the one Newton's method would have converged to
+    for well-behaved cash flows. Returns None if no sign change is found.
+    """
+    rates = np.union1d(_XIRR_BRACKET_RATES, [guess])
+    with np.errstate(over="ignore", invalid="ignore"):
+        values = np.array([func(r) for r in rates])
+    if not np.all(np.isfinite(values)):
+        return None
+    changes = np.flatnonzero(values[:-1] * values[1:] <= 0)
+    if not changes.size:
+        return None
+    mids = (rates[changes] + rates[changes + 1]) / 2
+    i = changes[np.argmin(np.abs(mids - guess))]
+    return float(rates[i]), float(rates[i + 1])
 
 
 def xirr_dates(
@@ -269,26 +522,15 @@ def xirr_dates(
     >>> dates = [datetime(2020, 1, 1), datetime(2020, 6, 1), datetime(2021, 1, 1),
     ...          datetime(2021, 6, 1), datetime(2022, 1, 1)]
     >>> xirr(cash_flows, dates)
-    np.float64(0.5831820341312749)
+    np.float64(0.58318...)
     """
     if len(cash_flows) != len(dates):
         raise ValueError("cash_flows and dates must have the same length")
     if len(cash_flows) < 2:
         raise ValueError("At least two cash flows are required")
 
-    # Convert all dates to number of days from the first date
-    t0 = dates[0]
-    times = [(d - t0).days / 365.0 for d in dates]
-
-    result = xirr_base(
-        cash_flows,
-        times,
-        guess=guess,
-        tol=tol,
-        max_iter=max_iter,
-    )
-
-    return result
+    flows = _CashFlows.from_dates(cash_flows, dates)
+    return _solve_xirr(flows, guess, tol, max_iter)
 
 
 def xirr(
@@ -353,22 +595,40 @@ def xirr(
     ...                index=pd.to_datetime(["2020-01-01", "2020-06-01", "2021-01-01",
     ...                                      "2021-06-01", "2022-01-01"]))
     >>> xirr(cf)
-    np.float64(0.5831820341312749)
+    np.float64(0.58318...)
     """
     if isinstance(cash_flows, dict):
         # dict: keys are dates, values are cash flows
-        dates_, cfs = zip(*sorted(cash_flows.items(), key=lambda x: x[0]))
-        dates = pd.to_datetime(dates_)
-        cash_flows = list(cfs)
+        items = sorted(cash_flows.items(), key=lambda x: x[0])
+        dates = _to_datetime64([d for d, _ in items])
+        cash_flows = np.fromiter((cf for _, cf in items), np.float64, len(items))
     elif isinstance(cash_flows, pd.Series):
-        dates = pd.to_datetime(cash_flows.index)
-        cash_flows = cash_flows.values.tolist()
+        dates = _to_datetime64(cash_flows.index)
+        cash_flows = cash_flows.to_numpy(dtype=np.float64)
     elif dates is not None:
-        dates = pd.to_datetime(dates)
-        cash_flows = list(cash_flows)
+        dates = _to_datetime64(dates)
+        cash_flows = np.asarray(cash_flows, dtype=np.float64)
     else:
         raise ValueError("If cash_flows is a sequence, dates must be provided.")
 
-    # Convert pandas Timestamps to datetime
-    dates = [d.to_pydatetime() if hasattr(d, "to_pydatetime") else d for d in dates]
     return xirr_dates(cash_flows, dates, guess=guess, tol=tol, max_iter=max_iter)
+
+
+def _to_datetime64(dates) -> np.ndarray:
+    """
+    Convert dates to a ``datetime64`` array at their native resolution.
+
+    Datetime objects, pandas Timestamps and ISO-8601 strings are converted
+    directly by NumPy; anything else (e.g., "01/06/2020") is parsed by
+    :func:`pandas.to_datetime`. Times of day are kept. Timezone-aware dates
+    have no NumPy representation, so they go through pandas and are converted
+    to naive UTC, which preserves the elapsed time between them.
+    """
+    if getattr(dates, "tz", None) is not None or (
+        len(dates) and getattr(dates[0], "tzinfo", None) is not None
+    ):
+        return pd.DatetimeIndex(dates).tz_convert(None).to_numpy()
+    try:
+        return np.asarray(dates, dtype="datetime64")
+    except (TypeError, ValueError):
+        return np.asarray(pd.to_datetime(dates), dtype="datetime64")
@@ -4,6 +4,32 @@ import numpy as np
 import pandas as pd
 
 
+def _as_array(data):
+    """Return ``data`` as a float array, plus the source frame for DataFrames."""
+    if isinstance(data, pd.Series):
+        return data.to_numpy(dtype=np.float64), None
+    if isinstance(data, pd.DataFrame):
+        return data.to_numpy(dtype=np.float64), data
+    return np.asarray(data, dtype=np.float64), None
+
+
+def _reduction_axis(arr, axis):
+    """The axis to reduce ``arr`` over; ``axis`` is ignored for 1-D input."""
+    return None if arr.ndim <= 1 else axis
+
+
+def _min_at_most(arr, bound):
+    """Whether the NaN-ignoring minimum of ``arr`` is at most ``bound``."""
+    return arr.size > 0 and np.fmin.reduce(arr, axis=None) <= bound
+
+
+def _relabel(result, frame, axis):
+    """Attach the column (or row) labels of ``frame`` to a reduced result."""
+    if frame is None or np.ndim(result) != 1 or axis not in (0, 1):
+        return result
+    return pd.Series(result, index=frame.columns if axis == 0 else frame.index)
+
+
 def geometric_mean(returns, axis=0):
     """
     Calculate the geometric mean of percent returns.
@@ -44,7 +70,7 @@ def geometric_mean(returns, axis=0):
     --------
     >>> import numpy as np
     >>> geometric_mean([0.05, 0.10, -0.02])
-    np.float64(0.04216388706767926)
+    np.float64(0.042163887067679...)
     >>> import pandas as pd
     >>> df = pd.DataFrame({
     ...     'Fund A': [0.05, 0.02, np.nan],
@@ -60,27 +86,12 @@ def geometric_mean(returns, axis=0):
     This function assumes returns are in decimal form (e.g., 0.10 = 10%).
     NaN values are ignored.
     """
-    returns = (
-        pd.DataFrame(returns)
-        if isinstance(returns, (pd.Series, pd.DataFrame))
-        else np.asarray(returns)
-    )
-
-    gross_returns = 1 + returns
-
-    if isinstance(gross_returns, pd.DataFrame):
-        if (gross_returns <= 0).any().any():
-            raise ValueError("All (1 + return) values must be positive.")
-        log_returns = np.log(gross_returns)
-        mean_log = log_returns.mean(axis=axis, skipna=True)
-        return np.exp(mean_log) - 1
-    else:
-        gross_returns = np.asarray(gross_returns)
-        if np.any(gross_returns <= 0):
-            raise ValueError("All (1 + return) values must be positive.")
-        log_returns = np.log(gross_returns)
-        mean_log = np.nanmean(log_returns, axis=axis)
-        return np.exp(mean_log) - 1
+    returns, frame = _as_array(returns)
+    if _min_at_most(returns, -1):
+        raise ValueError("All (1 + return) values must be positive.")
+    axis = _reduction_axis(returns, axis)
+    mean_log = np.nanmean(np.log1p(returns), axis=axis)
+    return _relabel(np.expm1(mean_log), frame, axis)
 
 
 def arithmetic_mean(returns, axis=0):
@@ -130,16 +141,9 @@ def arithmetic_mean(returns, axis=0):
     This function assumes returns are in decimal form (e.g., 0.10 = 10%).
     NaN values are ignored.
     """
-
-    returns = (
-        pd.DataFrame(returns)
-        if isinstance(returns, (pd.Series, pd.DataFrame))
-        else np.asarray(returns)
-    )
-    if isinstance(returns, pd.DataFrame) or isinstance(returns, pd.Series):
-        return returns.mean(axis=axis).round(10)
-    else:
-        return np.nanmean(returns, axis=axis).round(10)
+    returns, frame = _as_array(returns)
+    axis = _reduction_axis(returns, axis)
+    return _relabel(np.nanmean(returns, axis=axis).round(10), frame, axis)
 
 
 def harmonic_mean(values, axis=0):
@@ -200,31 +204,17 @@ def harmonic_mean(values, axis=0):
     - This function assumes returns are in decimal form (e.g., 0.10 = 10%).
     - NaN values are ignored. Returns less than or equal to zero will raise a ValueError.
     """
-    values = (
-        pd.DataFrame(values)
-        if isinstance(values, (pd.Series, pd.DataFrame))
-        else np.asarray(values)
-    )
-
-    if (
-        (values <= 0).any().any()
-        if isinstance(values, pd.DataFrame)
-        else (values <= 0).any()
-    ):
+    values, frame = _as_array(values)
+    if _min_at_most(values, 0):
         raise ValueError("All values must be > 0 for harmonic mean calculation.")
 
-    if isinstance(values, pd.DataFrame):
-        invert_values = 1 / values.replace(0, np.nan)
-        denom = invert_values.sum(axis=axis, skipna=True)
-        n = invert_values.count(axis=axis)
-        hmean = n / denom
-        return hmean
-    else:
-        values = values.astype(float)
-        values = values[values > 0]
-        n = len(values)
-        hmean = n / np.sum(1 / values)
-        return hmean
+    axis = _reduction_axis(values, axis)
+    inverse = np.reciprocal(values)
+    missing = np.isnan(inverse)
+    n = np.count_nonzero(~missing, axis=axis)
+    np.copyto(inverse, 0.0, where=missing)
+    hmean = n / inverse.sum(axis=axis)
+    return _relabel(hmean, frame, axis)
 
 
 def weighted_geometric_mean(returns, weights, axis=0):
@@ -263,18 +253,16 @@ def weighted_geometric_mean(returns, weights, axis=0):
     >>> weighted_geometric_mean([0.05, 0.10, 0.02], [1, 2, 1])
     np.float64(0.066949...)
     """
-    returns = np.asarray(returns)
-    weights = np.asarray(weights)
-    gross_returns = 1 + returns
-    filter_values = ~np.isnan(weights) & ~np.isnan(gross_returns)
-    if np.any(gross_returns <= 0):
+    returns = np.asarray(returns, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    if _min_at_most(returns, -1):
         raise ValueError("All (1 + return) values must be positive.")
-    weights = weights[filter_values] / np.nansum(
-        weights[filter_values], axis=axis, keepdims=True
-    )
-    log_returns = np.log(gross_returns)[filter_values]
-    weighted_log = np.nansum(weights * log_returns, axis=axis)
-    return np.exp(weighted_log) - 1
+    # NaN pairs get zero weight instead of being gathered out
+    valid = ~(np.isnan(returns) | np.isnan(weights))
+    weights = np.where(valid, weights, 0.0)
+    log_returns = np.where(valid, np.log1p(returns), 0.0)
+    weighted_log = np.sum(weights * log_returns, axis=axis) / np.sum(weights, axis=axis)
+    return np.expm1(weighted_log)
 
 
 def weighted_harmonic_mean(values, weights, axis=0):
@@ -316,11 +304,13 @@ def weighted_harmonic_mean(values, weights, axis=0):
     """
     values = np.asarray(values, dtype=float)
     weights = np.asarray(weights, dtype=float)
-    filter_values = ~np.isnan(weights) & ~np.isnan(values)
-    if np.any(values[filter_values] <= 0):
+    # NaN pairs get zero weight instead of being gathered out, and their
+    # values are not validated
+    valid = ~(np.isnan(values) | np.isnan(weights))
+    if _min_at_most(np.where(valid, values, np.nan), 0):
         raise ValueError("All values must be > 0 for harmonic mean calculation.")
-    weighted_sum = np.nansum(weights[filter_values])
-    weighted_reciprocal = np.nansum(
-        weights[filter_values] / values[filter_values], axis=axis
-    )
-    return weighted_sum / weighted_reciprocal
+    weights = np.where(valid, weights, 0.0)
+    inverse = np.reciprocal(np.where(valid, values, 1.0))
+    if weights.ndim == 1:
+        return np.sum(weights) / np.dot(weights, inverse)
+    return np.sum(weights, axis=axis) / np.sum(weights * inverse, axis=axis)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
 import pandas as pd
 
 
@@ -54,10 +57,10 @@ def calculate_payment(
     Examples
     --------
     >>> calculate_payment(200000, 0.04, 360, 1)
-    954.8305909309076
+    954.83059093091...
 
     >>> calculate_payment(100000, 0.05, 180, 3)
-    2378.9930086358786
+    2378.99300863587...
     """
     if payment_interval_months <= 0:
         raise ValueError("Payment interval (months) must be greater than zero.")
@@ -75,7 +78,138 @@ def calculate_payment(
     if periodic_rate == 0:
         return principal / total_payments
 
-    return principal * periodic_rate / (1 - (1 + periodic_rate) ** -total_payments)
+    # 1 - (1 + r)^-n, without cancellation for small rates
+    discount = -math.expm1(-total_payments * math.log1p(periodic_rate))
+    return principal * periodic_rate / discount
+
+
+def calculate_payments(
+    principals,
+    annual_rates,
+    term_months,
+    payment_interval_months=1,
+) -> np.ndarray:
+    """
+    Calculate the fixed periodic payment of many mortgages at once.
+
+    Vectorized counterpart of :func:`calculate_payment`: all arguments are
+    broadcast against each other and the payment formula is evaluated in a
+    single pass over the portfolio instead of one Python call per loan.
+
+    Parameters
+    ----------
+    principals : array-like
+        Original loan amounts.
+    annual_rates : array-like
+        Annual nominal interest rates as decimals.
+    term_months : array-like of int
+        Total loan terms in months.
+    payment_interval_months : array-like of int, optional
+        Months between payments (default is 1).
+
+    Returns
+    -------
+    numpy.ndarray
+        Payment per period of each loan.
+
+    Raises
+    ------
+    ValueError
+        If any payment interval is zero or negative, or if any loan has no
+        payments.
+
+    Examples
+    --------
+    >>> calculate_payments([200000, 100000], [0.04, 0.05], [360, 180], [1, 3])
+    array([ 954.83059093, 2378.99300864])
+    """
+    principals = np.asarray(principals, dtype=np.float64)
+    annual_rates = np.asarray(annual_rates, dtype=np.float64)
+    term_months = np.asarray(term_months)
+    payment_interval_months = np.asarray(payment_interval_months)
+    if np.any(payment_interval_months <= 0):
+        raise ValueError("Payment interval (months) must be greater than zero.")
+
+    total_payments = term_months // payment_interval_months
+    if np.any(total_payments <= 0):
+        raise ValueError(
+            "Total payments must be greater than zero. Ensure term_months "
+            "is greater than or equal to payment_interval_months."
+        )
+
+    periodic_rate = annual_rates / (12 / payment_interval_months)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        discount = -np.expm1(-total_payments * np.log1p(periodic_rate))
+        annuity = principals * periodic_rate / discount
+    return np.where(periodic_rate == 0, principals / total_payments, annuity)
+
+
+def amortization_balances(
+    principals,
+    annual_rates,
+    term_months,
+    payment_interval_months=1,
+) -> np.ndarray:
+    """
+    Remaining balance of every loan in a pool after each payment.
+
+    The balances of all loans are evaluated together from the closed form
+
+    .. math::
+        B_k = P (1 + r)^k - PMT \\frac{(1 + r)^k - 1}{r}
+
+    (or :math:`P - k \\cdot PMT` when :math:`r = 0`), with the payments taken
+    from :func:`calculate_payments`. Row ``i`` holds the balances of loan ``i``
+    after payments ``1, 2, ...``; loans with fewer payments than the longest
+    one are padded with NaN.
+
+    Parameters
+    ----------
+    principals : array-like
+        Original loan amounts.
+    annual_rates : array-like
+        Annual nominal interest rates as decimals.
+    term_months : array-like of int
+        Total loan terms in months.
+    payment_interval_months : array-like of int, optional
+        Months between payments (default is 1).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (n_loans, max_payments) with the remaining balances.
+
+    Examples
+    --------
+    >>> amortization_balances([1000, 1200], [0.12, 0.0], [3, 2]).round(2)
+    array([[669.98, 336.66,   0.  ],
+           [600.  ,   0.  ,    nan]])
+    """
+    payments = np.atleast_1d(
+        calculate_payments(
+            principals, annual_rates, term_months, payment_interval_months
+        )
+    )
+    principals, annual_rates, term_months, payment_interval_months = (
+        np.broadcast_to(arg, payments.shape)
+        for arg in (principals, annual_rates, term_months, payment_interval_months)
+    )
+    total_payments = term_months // payment_interval_months
+    periodic_rate = (annual_rates / (12 / payment_interval_months))[:, np.newaxis]
+    principals = np.asarray(principals, dtype=np.float64)[:, np.newaxis]
+    payments = payments[:, np.newaxis]
+
+    periods = np.arange(1, total_payments.max() + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth_less_one = np.expm1(periods * np.log1p(periodic_rate))
+        balances = np.where(
+            periodic_rate == 0,
+            principals - payments * periods,
+            principals + (principals - payments / periodic_rate) * growth_less_one,
+        )
+    np.clip(balances, 0, None, out=balances)
+    balances[periods > total_payments[:, np.newaxis]] = np.nan
+    return balances
 
 
 def generate_amortization_schedule(
@@ -110,7 +244,7 @@ def generate_amortization_schedule(
     >>> df.head() # doctest: +SKIP
        Period  Payment  Interest  Principal  Remaining Balance
     0       1   954.83   666.67     288.16          199711.84
-    1       2   954.83   665.71     289.12          199422.72
+    1       2   954.83   665.71     289.12          199422.71
     """
     payments_per_year = 12 / payment_interval_months
     total_payments = term_months // payment_interval_months
@@ -119,25 +253,26 @@ def generate_amortization_schedule(
         principal, annual_rate, term_months, payment_interval_months
     )
 
-    schedule = []
-    remaining_balance = principal
-
-    for period in range(1, total_payments + 1):
-        interest_payment = remaining_balance * periodic_rate
-        principal_payment = payment - interest_payment
-        remaining_balance -= principal_payment
-
-        schedule.append(
-            {
-                "Period": period,
-                "Payment": round(payment, 2),
-                "Interest": round(interest_payment, 2),
-                "Principal": round(principal_payment, 2),
-                "Remaining Balance": round(max(remaining_balance, 0), 2),
-            }
-        )
-
-    return pd.DataFrame(schedule)
+    # Closed-form balance after each payment, evaluated for all periods at once
+    periods = np.arange(1, total_payments + 1)
+    if periodic_rate == 0:
+        balance = principal - payment * periods
+    else:
+        growth = (1 + periodic_rate) ** periods
+        balance = principal * growth - payment * (growth - 1) / periodic_rate
+    opening_balance = np.concatenate(([principal], balance[:-1]))
+    interest = opening_balance * periodic_rate
+    principal_paid = payment - interest
+
+    return pd.DataFrame(
+        {
+            "Period": periods,
+            "Payment": np.full(total_payments, round(payment, 2)),
+            "Interest": np.round(interest, 2),
+            "Principal": np.round(principal_paid, 2),
+            "Remaining Balance": np.round(np.clip(balance, 0, None), 2),
+        }
+    )
 
 
 def mortgage_cash_flows(
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
+
+_SCALAR_TYPES = (int, float, np.number)
+
 
 def present_value_annuity(payment: float, rate: float, periods: int) -> float:
     """
@@ -16,6 +22,9 @@ def present_value_annuity(payment: float, rate: float, periods: int) -> float:
         - :math:`r` is the interest rate per period
         - :math:`n` is the total number of periods
 
+    Scalar inputs are evaluated in plain Python; if `rate` or `periods` is
+    array-like the call is routed to :func:`present_value_annuity_batch`.
+
     Parameters
     ----------
     payment : float
@@ -34,11 +43,86 @@ def present_value_annuity(payment: float, rate: float, periods: int) -> float:
     --------
     >>> present_value_annuity(100, 0.05, 10)
     772.17...
+    >>> present_value_annuity(100, [0.05, 0.10], 10)
+    array([772.17..., 614.45...])
+    """
+    if isinstance(rate, _SCALAR_TYPES) and isinstance(periods, _SCALAR_TYPES):
+        return payment * _annuity_factors(rate, periods)[0]
+    return present_value_annuity_batch(payment, rate, periods)
+
+
+def _annuity_factors(rate: float, periods: int) -> tuple[float, float]:
+    """
+    Return the annuity factor and the discount factor :math:`(1 + r)^{-n}`.
+
+    Both come from a single ``log1p``/``expm1`` evaluation, so callers that
+    need the annuity value and the discount to the end of the term (the
+    two-stage valuations) pay for one transcendental pair instead of several
+    powers. Array-like arguments are handed to :func:`_annuity_factors_batch`.
     """
+    if not (isinstance(rate, _SCALAR_TYPES) and isinstance(periods, _SCALAR_TYPES)):
+        return _annuity_factors_batch(rate, periods)
     if rate == 0:
-        return payment * periods
-    pv = payment * (1 - (1 + rate) ** -periods) / rate
-    return pv
+        return periods, 1.0
+    # (1 + r)^-n - 1, without cancellation for small rates
+    discount_less_one = math.expm1(-periods * math.log1p(rate))
+    return -discount_less_one / rate, 1 + discount_less_one
+
+
+def present_value_annuity_batch(payment, rate, periods) -> np.ndarray:
+    """
+    Calculate the present value of many fixed annuities at once.
+
+    Vectorized counterpart of :func:`present_value_annuity` for scenario
+    analysis: `payment`, `rate` and `periods` are broadcast against each other
+    and the annuity formula is evaluated element-wise, with :math:`P \\times n`
+    where the rate is zero.
+
+    The computation runs in the floating dtype of `rate` (float64 for integer
+    or list input), so ``float32`` rate arrays halve memory traffic for large
+    Monte-Carlo grids where single precision is sufficient.
+
+    Parameters
+    ----------
+    payment : array-like
+        The fixed payment amount per period.
+    rate : array-like
+        The interest rate per period (as a decimal).
+    periods : array-like
+        The total number of periods.
+
+    Returns
+    -------
+    numpy.ndarray
+        Present value of each annuity.
+
+    Examples
+    --------
+    >>> present_value_annuity_batch(100, [0.0, 0.05, 0.10], 10)
+    array([1000.        ,  772.17349292,  614.45671057])
+    """
+    annuity = _annuity_factors_batch(rate, periods)[0]
+    return _as_float(payment, annuity.dtype) * annuity
+
+
+def _as_float(values, default=np.float64) -> np.ndarray:
+    """Return ``values`` as an array, casting non-float input to ``default``."""
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        return values
+    return values.astype(default)
+
+
+def _annuity_factors_batch(rate, periods) -> tuple[np.ndarray, np.ndarray]:
+    """Array counterpart of :func:`_annuity_factors`, broadcasting its inputs."""
+    rate = _as_float(rate)
+    periods = _as_float(periods, rate.dtype)
+    is_zero = rate == 0
+    # Divide by one where the rate is zero; those entries are replaced below
+    safe_rate = np.where(is_zero, 1.0, rate)
+    discount_less_one = np.where(is_zero, 0.0, np.expm1(-periods * np.log1p(safe_rate)))
+    annuity = np.where(is_zero, periods, -discount_less_one / safe_rate)
+    return annuity, 1 + discount_less_one
 
 
 def present_value_annuity_annual(
@@ -137,7 +221,8 @@ def present_value_growing_annuity(
     >>> present_value_growing_annuity(100, 0.05, 10, 0.05)
     1000
     """
-    return present_value_annuity(payment, (1 + rate) / (1 + growth) - 1, periods)
+    # (1 + r) / (1 + g) - 1, written so that it is exactly zero when r == g
+    return present_value_annuity(payment, (rate - growth) / (1 + growth), periods)
 
 
 def present_value_growing_perpetuity(
@@ -187,13 +272,49 @@ def present_value_growing_perpetuity(
     Examples
     --------
     >>> present_value_growing_perpetuity(100, 0.05, 0.02)
-    3400.0
+    3399.99...
     """
     if rate <= growth:
         raise ValueError(
             "Interest rate must be greater than growth rate for perpetuity."
         )
-    return round(payment * (1 + growth) / (rate - growth), 10)
+    return payment * (1 + growth) / (rate - growth)
+
+
+def present_value_growing_perpetuity_batch(payment, rate, growth) -> np.ndarray:
+    """
+    Calculate the present value of many growing perpetuities at once.
+
+    Vectorized counterpart of :func:`present_value_growing_perpetuity` for
+    Gordon-growth scenario runs: all arguments are broadcast against each
+    other. Instead of raising, scenarios with ``rate <= growth`` are NaN so
+    they can be filtered downstream.
+
+    Parameters
+    ----------
+    payment : array-like
+        The initial payment amount per period.
+    rate : array-like
+        The interest rate per period (as a decimal).
+    growth : array-like
+        The growth rate of the payments (as a decimal).
+
+    Returns
+    -------
+    numpy.ndarray
+        Present value of each growing perpetuity, NaN where ``rate <= growth``.
+
+    Examples
+    --------
+    >>> present_value_growing_perpetuity_batch(100, [0.05, 0.02], 0.02)
+    array([3400.,   nan])
+    """
+    rate = _as_float(rate)
+    growth = _as_float(growth, rate.dtype)
+    spread = rate - growth
+    # NaN spreads make the invalid scenarios NaN without a division warning
+    spread = np.where(spread > 0, spread, np.nan)
+    return _as_float(payment, spread.dtype) * (1 + growth) / spread
 
 
 def present_value_two_stage_annuity(
@@ -209,9 +330,10 @@ def present_value_two_stage_annuity(
     where:
         - :math:`PV_{\\text{stage1}}` is the present value of the first stage annuity
         - :math:`PV_{\\text{stage2}}` is the present value of the second stage annuity
-    The present value of the first stage is calculated using the `present_value_annuity`
-    function, and the second stage is calculated using the `present_value_annuity`
-    function, discounted back to the present using the interest rate of the first stage.
+    Both stages are valued with the `present_value_annuity` formula, and the second
+    stage is discounted back to the present using the interest rate of the first stage.
+    The first-stage annuity and discount factors share a single ``log1p``/``expm1``
+    evaluation.
 
     Note
     ----
@@ -243,11 +365,50 @@ def present_value_two_stage_annuity(
     >>> present_value_two_stage_annuity(100, 0.05, 0.06, 5, 5)
     762.99...
     """
-    pv_stage1 = present_value_annuity(payment, rate1, periods1)
-    pv_stage2 = (
-        present_value_annuity(payment, rate2, periods2) / (1 + rate1) ** periods1
-    )
-    return pv_stage1 + pv_stage2
+    annuity1, discount1 = _annuity_factors(rate1, periods1)
+    annuity2 = _annuity_factors(rate2, periods2)[0]
+    return payment * (annuity1 + annuity2 * discount1)
+
+
+def present_value_two_stage_annuity_batch(
+    payment, rate1, rate2, periods1, periods2
+) -> np.ndarray:
+    """
+    Calculate the present value of many two-stage annuities at once.
+
+    Vectorized counterpart of :func:`present_value_two_stage_annuity` for
+    scenario grids: all arguments are broadcast against each other, so e.g. a
+    column of first-stage rates and a row of second-stage rates price the
+    whole (rate1, rate2) grid in one call.
+
+    Parameters
+    ----------
+    payment : array-like
+        The fixed payment amount per period.
+    rate1 : array-like
+        Interest rate for the first stage (as a decimal).
+    rate2 : array-like
+        Interest rate for the second stage (as a decimal).
+    periods1 : array-like
+        Number of periods in the first stage.
+    periods2 : array-like
+        Number of periods in the second stage.
+
+    Returns
+    -------
+    numpy.ndarray
+        Present value of each two-stage annuity.
+
+    Examples
+    --------
+    >>> present_value_two_stage_annuity_batch(100, [[0.04], [0.05]], [0.06, 0.07], 5, 5)
+    array([[791.40..., 782.18...],
+           [762.99..., 754.20...]])
+    """
+    annuity1, discount1 = _annuity_factors_batch(rate1, periods1)
+    annuity2 = _annuity_factors_batch(rate2, periods2)[0]
+    factor = annuity1 + annuity2 * discount1
+    return _as_float(payment, factor.dtype) * factor
 
 
 def present_value_two_stage_annuity_perpetuity(
@@ -269,10 +430,12 @@ def present_value_two_stage_annuity_perpetuity(
     where:
         - :math:`PV_{\\text{stage1}}` is the present value of the first stage annuity
         - :math:`PV_{\\text{stage2}}` is the present value of the second stage perpetuity.
-    The present value of the first stage is calculated using the `present_value_growing_annuity`
-    function, and the second stage is calculated using the `present_value_growing_perpetuity`
-    function.
-    The perpetuity is discounted back to the present using the interest rate of the first stage.
+    The first stage uses the `present_value_growing_annuity` formula and the second stage
+    the `present_value_growing_perpetuity` formula.
+    The perpetuity, whose payment has grown over the first stage, is discounted back to
+    the present using the interest rate of the first stage; this equals discounting the
+    initial payment at the growth-adjusted first-stage rate, which also drives the
+    first-stage annuity, so both stages share one discount factor.
 
     Note
     ----
@@ -311,14 +474,13 @@ def present_value_two_stage_annuity_perpetuity(
     >>> present_value_two_stage_annuity_perpetuity(100, 0.05, 5, 0.06, 0.02, 0.01)
     2206.19...
     """
-    # Present value of first stage (fixed annuity)
-    pv_stage1 = present_value_growing_annuity(payment, rate1, periods1, growth1)
-    # Update payment for perpetuity to reflect growth over first stage
-    payment_perpetuity = (
-        payment * (1 + growth1) ** periods1 if growth1 != 0 else payment
-    )
-    # Use present_value_growing_perpetuity for perpetuity at the end of stage 1
-    pv_perpetuity = present_value_growing_perpetuity(payment_perpetuity, rate2, growth2)
-    # Discount perpetuity back to present
-    pv_stage2 = pv_perpetuity / (1 + rate1) ** periods1
-    return pv_stage1 + pv_stage2
+    if rate2 <= growth2:
+        raise ValueError(
+            "Interest rate must be greater than growth rate for perpetuity."
+        )
+    # Both stages discount at the growth-adjusted rate of the first stage:
+    # the perpetuity payment grown over stage 1 and discounted back to t=0
+    # is payment * ((1 + g1) / (1 + r1)) ** periods1.
+    annuity1, discount1 = _annuity_factors((rate1 - growth1) / (1 + growth1), periods1)
+    pv_perpetuity = payment * (1 + growth2) / (rate2 - growth2)
+    return payment * annuity1 + pv_perpetuity * discount1
@@ -13,39 +13,88 @@ Supported conversions:
 * Bond Equivalent Yield (BEY, semiannual-pay bond convention) <-> Effective annual rate (EAR)
 
 These conversions are essential for comparing, quoting, and reporting interest rates and yields across different financial products, regulatory frameworks, and institutional conventions.
+
+All conversions accept NumPy arrays and keep their floating dtype, so float32 rate arrays (e.g. large Monte Carlo scenario sets) stay float32 throughout. Expect results accurate to roughly 1e-6 in absolute terms in that case; pass float64 arrays when more precision is needed. Period, day and base-year arguments may be arrays too, and broadcast against the rate (e.g. one rate quoted under several compounding frequencies).
 """
 
 from __future__ import annotations
 
+import math
+from functools import lru_cache, partial
 
 import numpy as np
 
 
 # --- Internal helpers for exponentiation logic ---
-def _exp_general(base, n):
+# Compounding is written as expm1(n * log1p(x)) rather than (1 + x)^n - 1:
+# adding and then subtracting 1 cancels most of the digits of a small rate.
+# Scalars go through the math module: a NumPy ufunc call on a Python float
+# costs far more than the arithmetic itself. Scalar results are still
+# returned as np.float64 so that callers see the same type either way.
+# The converters inline the scalar case themselves, which saves a Python
+# call on that path; the helper handles arrays and mixed inputs.
+# log1p is only defined above -1: a scalar rate per period at or below -1
+# raises ValueError, while array entries follow NumPy and give NaN (or -1.0
+# for exactly -1), so one bad scenario does not abort a whole batch.
+def _compound_log1p(x, n):
     """
-    Generalized exponentiation for rate conversions:
-    Returns :math:`base^n - 1`
+    Returns :math:`(1 + x)^n - 1` as ``expm1(n * log1p(x))``, which keeps full
+    precision when :math:`x` is small.
     """
-    return np.power(base, n) - 1
+    if isinstance(x, np.ndarray) or isinstance(n, np.ndarray):
+        out = np.log1p(x)
+        if isinstance(n, np.ndarray) or not isinstance(out, np.ndarray):
+            return np.expm1(n * out)
+        # out is a fresh buffer: scale and exponentiate it in place
+        np.multiply(out, n, out=out)
+        return np.expm1(out, out=out)
+    if x <= -1:
+        raise ValueError("rate per period must be greater than -1.")
+    return np.float64(math.expm1(n * math.log1p(x)))
 
 
 # --- Centralized input validation ---
+# Exact scalar types that can be compared directly; checking ``type(x) in``
+# this tuple is the cheapest test and keeps bool out of the fast path.
+_SCALAR_TYPES = (float, int, np.float64)
+
+
 def _validate_numeric(x, name="value"):
     if not isinstance(x, (int, float, np.ndarray)):
         raise TypeError(f"{name} must be a number or numpy array.")
 
 
 def _validate_positive_number(x, name="value"):
-    if not (isinstance(x, (int, float)) and not isinstance(x, bool)):
-        raise TypeError(f"{name} must be a positive integer or float.")
-    if x <= 0:
+    # NaN fails no comparison, so it propagates to the result for scalars and
+    # (via the NaN-ignoring minimum) for array entries alike
+    if type(x) in _SCALAR_TYPES:
+        invalid = x <= 0
+    elif isinstance(x, np.ndarray):
+        if x.dtype.kind not in "iuf":
+            raise TypeError(f"{name} must be a positive number or numpy array.")
+        invalid = x.size > 0 and np.fmin.reduce(x, axis=None) <= 0
+    elif isinstance(x, (int, float)) and not isinstance(x, bool):
+        invalid = x <= 0
+    else:
+        raise TypeError(f"{name} must be a positive number or numpy array.")
+    if invalid:
         raise ValueError(f"{name} must be positive.")
 
 
 def _validate_effective_rate(effective_rate):
+    if type(effective_rate) in _SCALAR_TYPES:
+        if effective_rate <= -1:
+            raise ValueError("effective_rate must be greater than -1.")
+        return
     _validate_numeric(effective_rate, "effective_rate")
-    if np.any(np.less_equal(effective_rate, -1)):
+    if isinstance(effective_rate, np.ndarray):
+        # NaN-ignoring minimum: one pass, no boolean mask
+        invalid = (
+            effective_rate.size > 0 and np.fmin.reduce(effective_rate, axis=None) <= -1
+        )
+    else:
+        invalid = effective_rate <= -1
+    if invalid:
         raise ValueError("effective_rate must be greater than -1.")
 
 
@@ -60,16 +109,19 @@ YIELD_CALCULATION_ADJUSTMENTS = {
 }
 
 
-def convert_yield(rate: float, from_convention: str, to_convention: str) -> float:
+def convert_yield(
+    rate: float | np.ndarray, from_convention: str, to_convention: str
+) -> float | np.ndarray:
     """
     Convert a yield from one convention to another.
 
     This is useful for comparing yields across different financial products and conventions.
+    A whole curve can be converted at once by passing an array of rates.
 
     Parameters:
     -----------
-    rate : float
-        The interest rate to convert, expressed as a decimal (e.g., 0.05 for 5%).
+    rate : float or array-like
+        The interest rate(s) to convert, expressed as a decimal (e.g., 0.05 for 5%).
     from_convention : str
         The current yield calculation convention of the rate. Must be one of "Annual", "Continuous", "BEY", "BEY-Q", "BEY-M".
     to_convention : str
@@ -77,46 +129,109 @@ def convert_yield(rate: float, from_convention: str, to_convention: str) -> floa
 
     Returns
     -------
-    float
-        The converted interest rate, expressed as a decimal.
+    float or numpy.ndarray
+        The converted interest rate(s), expressed as a decimal.
 
     Examples
     --------
     >>> convert_yield(0.05, "BEY", "Annual")
-    np.float64(0.050624...)
+    np.float64(0.050625...)
     >>> convert_yield(0.05, "BEY", "Continuous")
     np.float64(0.049385...)
     >>> convert_yield(0.05, "Continuous", "Annual")
     np.float64(0.051271...)
+    >>> convert_yield([0.04, 0.05], "BEY", "Annual")
+    array([0.0404    , 0.050625...])
     """
     if from_convention == to_convention:
         return rate
+    if type(rate) in _SCALAR_TYPES:
+        return _convert_yield_cached(rate, from_convention, to_convention)
+    if not isinstance(rate, np.ndarray):
+        rate = np.asarray(rate, dtype=np.float64)
+    return _convert_yield(rate, from_convention, to_convention)
+
+
+def _convert_yield(rate, from_convention: str, to_convention: str):
+    """Uncached body of :func:`convert_yield`."""
     # Convert to effective annual as intermediate
-    if from_convention == "Continuous":
-        eff = continuous_to_effective(rate)
-    elif from_convention == "Annual":
-        eff = rate
-    elif "BEY" in from_convention and from_convention in YIELD_CALCULATION_ADJUSTMENTS:
-        eff = nominal_periods_to_effective(
-            rate, periods_per_year=int(YIELD_CALCULATION_ADJUSTMENTS[from_convention])
-        )
-    else:
-        raise ValueError(
-            f"Unknown or unsupported yield calculation convention: {from_convention}"
-        )
+    for convention in (from_convention, to_convention):
+        if convention not in _TO_EFFECTIVE:
+            raise ValueError(
+                f"Unknown or unsupported yield calculation convention: {convention}"
+            )
+    direct = _DIRECT.get((from_convention, to_convention))
+    if direct is not None:
+        return direct(rate)
+    return _FROM_EFFECTIVE[to_convention](_TO_EFFECTIVE[from_convention](rate))
 
-    if to_convention == "Annual":
-        return eff
-    elif to_convention == "Continuous":
-        return effective_to_continuous(eff)
-    elif "BEY" in to_convention and to_convention in YIELD_CALCULATION_ADJUSTMENTS:
-        return effective_to_nominal_periods(
-            eff, periods_per_year=int(YIELD_CALCULATION_ADJUSTMENTS[to_convention])
-        )
-    else:
-        raise ValueError(
-            f"Unknown or unsupported yield calculation convention: {to_convention}"
-        )
+
+# Curve building and sensitivity tables repeat the same scalar conversions
+_convert_yield_cached = lru_cache(maxsize=4096, typed=True)(_convert_yield)
+
+
+def convert_yield_batch(rates, from_conventions, to_conventions) -> np.ndarray:
+    """
+    Convert many yields quoted under mixed conventions at once.
+
+    ``rates``, ``from_conventions`` and ``to_conventions`` are parallel arrays
+    that broadcast against each other, e.g. one column per field of a
+    portfolio of quotes. Rates sharing a (from, to) pair are converted with a
+    single vectorized call to :func:`convert_yield`, so the cost grows with
+    the number of distinct conventions rather than the number of rates.
+
+    Parameters
+    ----------
+    rates : array-like
+        The interest rates to convert, expressed as decimals.
+    from_conventions : str or array-like of str
+        Current convention of each rate. Each must be one of "Annual",
+        "Continuous", "BEY", "BEY-Q", "BEY-M".
+    to_conventions : str or array-like of str
+        Target convention of each rate, from the same set.
+
+    Returns
+    -------
+    numpy.ndarray
+        The converted rates, with the broadcast shape of the inputs.
+
+    Raises
+    ------
+    ValueError
+        If any convention is unknown or the inputs cannot be broadcast.
+
+    Examples
+    --------
+    >>> convert_yield_batch([0.05, 0.05, 0.04], ["BEY", "Continuous", "BEY"], "Annual")
+    array([0.050625 , 0.0512711, 0.0404   ])
+    """
+    rates, from_conventions, to_conventions = np.broadcast_arrays(
+        np.asarray(rates, dtype=np.float64),
+        np.asarray(from_conventions),
+        np.asarray(to_conventions),
+    )
+    # One string comparison per known convention, instead of sorting labels
+    masks = []
+    for conventions in (from_conventions, to_conventions):
+        by_name = {
+            name: conventions == name for name in VALID_YIELD_CALCULATION_CONVENTIONS
+        }
+        unknown = ~np.logical_or.reduce(list(by_name.values()))
+        if unknown.any():
+            raise ValueError(
+                "Unknown or unsupported yield calculation convention: "
+                f"{conventions[unknown][0]}"
+            )
+        masks.append([(name, mask) for name, mask in by_name.items() if mask.any()])
+    result = np.empty(rates.shape)
+    for from_convention, from_mask in masks[0]:
+        for to_convention, to_mask in masks[1]:
+            mask = from_mask & to_mask
+            if mask.any():
+                result[mask] = convert_yield(
+                    rates[mask], from_convention, to_convention
+                )
+    return result
 
 
 def get_time_adjustment(yield_calculation_convention: str) -> float:
@@ -164,7 +279,9 @@ def continuous_to_effective(rate: float) -> float:
     np.float64(0.051271...)
     """
     _validate_numeric(rate, "rate")
-    return np.expm1(rate)
+    if isinstance(rate, np.ndarray):
+        return np.expm1(rate)
+    return np.float64(math.expm1(rate))
 
 
 def effective_to_continuous(effective_rate: float) -> float:
@@ -197,7 +314,9 @@ def effective_to_continuous(effective_rate: float) -> float:
     np.float64(0.05...)
     """
     _validate_effective_rate(effective_rate)
-    return np.log1p(effective_rate)
+    if isinstance(effective_rate, np.ndarray):
+        return np.log1p(effective_rate)
+    return np.float64(math.log1p(effective_rate))
 
 
 # periodic_to_effective <-> effective_to_periodic conversions
@@ -243,7 +362,12 @@ def nominal_periods_to_effective(nominal_rate: float, periods_per_year: int) ->
     """
     _validate_numeric(nominal_rate, "nominal_rate")
     _validate_positive_number(periods_per_year, "periods_per_year")
-    return _exp_general(1 + nominal_rate / periods_per_year, periods_per_year)
+    period_rate = nominal_rate / periods_per_year
+    if isinstance(period_rate, float):
+        if period_rate <= -1:
+            raise ValueError("nominal_rate / periods_per_year must be greater than -1.")
+        return np.float64(math.expm1(periods_per_year * math.log1p(period_rate)))
+    return _compound_log1p(period_rate, periods_per_year)
 
 
 def effective_to_nominal_periods(effective_rate: float, periods_per_year: int) -> float:
@@ -287,7 +411,13 @@ def effective_to_nominal_periods(effective_rate: float, periods_per_year: int) -
     """
     _validate_effective_rate(effective_rate)
     _validate_positive_number(periods_per_year, "periods_per_year")
-    return _exp_general(1 + effective_rate, 1 / periods_per_year) * periods_per_year
+    exponent = 1 / periods_per_year
+    if isinstance(effective_rate, float) and isinstance(exponent, float):
+        return (
+            np.float64(math.expm1(exponent * math.log1p(effective_rate)))
+            * periods_per_year
+        )
+    return _compound_log1p(effective_rate, exponent) * periods_per_year
 
 
 # nominal_days_to_effective <-> effective_to_nominal_days conversions
@@ -339,7 +469,12 @@ def nominal_days_to_effective(
     _validate_positive_number(days, "days")
     _validate_positive_number(base_year, "base_year")
     periods = base_year / days
-    return _exp_general(1 + nominal_rate / periods, periods)
+    period_rate = nominal_rate / periods
+    if isinstance(period_rate, float):
+        if period_rate <= -1:
+            raise ValueError("nominal_rate * days / base_year must be greater than -1.")
+        return np.float64(math.expm1(periods * math.log1p(period_rate)))
+    return _compound_log1p(period_rate, periods)
 
 
 def effective_to_nominal_days(
@@ -389,7 +524,10 @@ def effective_to_nominal_days(
     _validate_positive_number(days, "days")
     _validate_positive_number(base_year, "base_year")
     periods = base_year / days
-    return _exp_general(1 + effective_rate, 1 / periods) * periods
+    exponent = 1 / periods
+    if isinstance(effective_rate, float) and isinstance(exponent, float):
+        return np.float64(math.expm1(exponent * math.log1p(effective_rate))) * periods
+    return _compound_log1p(effective_rate, exponent) * periods
 
 
 # single_period_to_effective <-> effective_to_period conversions
@@ -432,11 +570,12 @@ def single_period_to_effective(period_rate: float, periods: int) -> float:
     np.float64(0.12682...)
     """
     _validate_numeric(period_rate, "period_rate")
-    if not isinstance(periods, (int, float)):
-        raise TypeError("periods must be a number.")
-    if periods <= 0:
-        raise ValueError("periods must be positive.")
-    return _exp_general(1 + period_rate, periods)
+    _validate_positive_number(periods, "periods")
+    if isinstance(period_rate, float) and not isinstance(periods, np.ndarray):
+        if period_rate <= -1:
+            raise ValueError("period_rate must be greater than -1.")
+        return np.float64(math.expm1(periods * math.log1p(period_rate)))
+    return _compound_log1p(period_rate, periods)
 
 
 def effective_to_single_period(effective_rate: float, periods: int) -> float:
@@ -477,7 +616,10 @@ def effective_to_single_period(effective_rate: float, periods: int) -> float:
     """
     _validate_effective_rate(effective_rate)
     _validate_positive_number(periods, "periods")
-    return _exp_general(1 + effective_rate, 1 / periods)
+    exponent = 1 / periods
+    if isinstance(effective_rate, float) and isinstance(exponent, float):
+        return np.float64(math.expm1(exponent * math.log1p(effective_rate)))
+    return _compound_log1p(effective_rate, exponent)
 
 
 # money_market_rate_to_effective <-> effective_to_money_market_rate conversions
@@ -531,9 +673,21 @@ def money_market_rate_to_effective(
     _validate_positive_number(days, "days")
     _validate_positive_number(base, "base")
     if discount:
-        return _exp_general(1 / (1 - mmr * days / base), base / days)
+        # (1 / (1 - y))^k - 1 == expm1(-k * log1p(-y)), with y = mmr * days / base
+        discount_fraction = mmr * days / base
+        if isinstance(discount_fraction, float) and discount_fraction >= 1:
+            raise ValueError(
+                "mmr * days / base must be less than 1 for a discount rate "
+                "(the discount would exceed the face value)."
+            )
+        return _compound_log1p(-discount_fraction, -base / days)
     else:
-        return _exp_general(1 + mmr * days / base, base / days)
+        period_rate = mmr * days / base
+        if isinstance(period_rate, float):
+            if period_rate <= -1:
+                raise ValueError("mmr * days / base must be greater than -1.")
+            return np.float64(math.expm1(base / days * math.log1p(period_rate)))
+        return _compound_log1p(period_rate, base / days)
 
 
 def effective_to_money_market_rate(
@@ -592,20 +746,20 @@ def effective_to_money_market_rate(
     _validate_positive_number(base, "base")
     if discount:
         # Discount basis: mmr = (1 - 1 / (1 + EAR) ** (days/base) ) * (base/days)
-        # effective_rate = _exp_general(1 / (1 - mmr * days / base), base / days)
+        # effective_rate = (1 / (1 - mmr * days / base)) ** (base / days) - 1
         # (1 + effective_rate) ** (days / base ) = (1 / (1 - mmr * days / base)
         # 1 / (1 + effective_rate) ** (days / base ) = (1 - mmr * days / base)
-        return round(
-            (1 - 1 / (np.power(1 + effective_rate, days / base if t is None else t)))
-            * (base / days),
-            10,
-        )
+        exponent = days / base if t is None else t
+        return -_compound_log1p(effective_rate, -exponent) * (base / days)
     else:
-        return (
-            _exp_general(1 + effective_rate, days / base if t is None else t)
-            * base
-            / days
-        )
+        exponent = days / base if t is None else t
+        if isinstance(effective_rate, float) and isinstance(exponent, float):
+            return (
+                np.float64(math.expm1(exponent * math.log1p(effective_rate)))
+                * base
+                / days
+            )
+        return _compound_log1p(effective_rate, exponent) * base / days
 
 
 # Bond Equivalent Yield (BEY) <-> Effective Annual Rate conversions
@@ -640,7 +794,12 @@ def bey_to_effective_annual(bey: float) -> float:
     np.float64(0.060899...)
     """
     semiannual = bey / 2
-    return _exp_general(1 + semiannual, 2)
+    # (1 + s)^2 - 1 expanded: no pow call and no cancellation for small s
+    effective_rate = semiannual * (2 + semiannual)
+    if type(bey) in _SCALAR_TYPES:
+        return np.float64(effective_rate)
+    # arrays, Series and NumPy scalars keep their own type
+    return effective_rate
 
 
 def effective_annual_to_bey(effective_rate: float) -> float:
@@ -671,9 +830,16 @@ def effective_annual_to_bey(effective_rate: float) -> float:
     Examples
     --------
     >>> effective_annual_to_bey(0.0609)
-    np.float64(0.060000...)
+    np.float64(0.06...)
     """
-    return 2 * _exp_general(1 + effective_rate, 1 / 2)
+    # 2 * (sqrt(1 + EAR) - 1) rationalized to avoid cancellation for small EAR
+    if type(effective_rate) in _SCALAR_TYPES:
+        _validate_effective_rate(effective_rate)
+        return np.float64(2 * effective_rate / (math.sqrt(1 + effective_rate) + 1))
+    if isinstance(effective_rate, np.ndarray):
+        _validate_effective_rate(effective_rate)
+    # arrays, Series and NumPy scalars go through np.sqrt and keep their type
+    return 2 * effective_rate / (np.sqrt(1 + effective_rate) + 1)
 
 
 def convert_effective_to_mmr(
@@ -729,3 +895,53 @@ def convert_effective_to_mmr(
         raise ValueError(
             f"Unknown or unsupported yield calculation convention: {yield_calculation_convention}"
         )
+
+
+# --- convert_yield dispatch tables: convention -> conversion to/from EAR ---
+def _identity(rate):
+    return rate
+
+
+_TO_EFFECTIVE = {
+    "Annual": _identity,
+    "Continuous": continuous_to_effective,
+    "BEY": partial(nominal_periods_to_effective, periods_per_year=2),
+    "BEY-Q": partial(nominal_periods_to_effective, periods_per_year=4),
+    "BEY-M": partial(nominal_periods_to_effective, periods_per_year=12),
+}
+_FROM_EFFECTIVE = {
+    "Annual": _identity,
+    "Continuous": effective_to_continuous,
+    "BEY": partial(effective_to_nominal_periods, periods_per_year=2),
+    "BEY-Q": partial(effective_to_nominal_periods, periods_per_year=4),
+    "BEY-M": partial(effective_to_nominal_periods, periods_per_year=12),
+}
+
+
+# Nominal <-> continuous pairs skip the effective annual intermediate:
+# (1 + r/n)^n - 1 followed by log1p collapses to n * log1p(r/n), and the
+# reverse to n * expm1(r/n), which is cheaper and exact for small rates.
+def _nominal_to_continuous(rate, periods_per_year):
+    _validate_numeric(rate, "rate")
+    if isinstance(rate, np.ndarray):
+        return periods_per_year * np.log1p(rate / periods_per_year)
+    if rate / periods_per_year <= -1:
+        raise ValueError("rate / periods_per_year must be greater than -1.")
+    return np.float64(periods_per_year * math.log1p(rate / periods_per_year))
+
+
+def _continuous_to_nominal(rate, periods_per_year):
+    _validate_numeric(rate, "rate")
+    if isinstance(rate, np.ndarray):
+        return periods_per_year * np.expm1(rate / periods_per_year)
+    return np.float64(periods_per_year * math.expm1(rate / periods_per_year))
+
+
+_DIRECT = {
+    ("BEY", "Continuous"): partial(_nominal_to_continuous, periods_per_year=2),
+    ("BEY-Q", "Continuous"): partial(_nominal_to_continuous, periods_per_year=4),
+    ("BEY-M", "Continuous"): partial(_nominal_to_continuous, periods_per_year=12),
+    ("Continuous", "BEY"): partial(_continuous_to_nominal, periods_per_year=2),
+    ("Continuous", "BEY-Q"): partial(_continuous_to_nominal, periods_per_year=4),
+    ("Continuous", "BEY-M"): partial(_continuous_to_nominal, periods_per_year=12),
+}
@@ -2,12 +2,27 @@
 real_rates.py
 
 Module for computing real interest rates using the Fisher equation and related methods.
+
+Both functions broadcast: pass arrays (or lists) of nominal and inflation
+rates with compatible shapes, e.g. a column of tenors against a row of
+inflation scenarios, to get the whole grid in one call.
 """
 
 from __future__ import annotations
 
+import numpy as np
+
+
+def _as_rate(x):
+    """Coerces lists and tuples to float arrays; other inputs pass through."""
+    if isinstance(x, (list, tuple)):
+        return np.asarray(x, dtype=np.float64)
+    return x
+
 
-def fisher_real_rate(nominal_rate: float, inflation_rate: float) -> float:
+def fisher_real_rate(
+    nominal_rate: float | np.ndarray, inflation_rate: float | np.ndarray
+) -> float | np.ndarray:
     """
     Compute the real interest rate using the approximate Fisher equation.
 
@@ -19,25 +34,29 @@ def fisher_real_rate(nominal_rate: float, inflation_rate: float) -> float:
 
     Parameters
     ----------
-    nominal_rate : float
+    nominal_rate : float or array-like
         Nominal interest rate as a decimal (e.g., 0.05 for 5%).
-    inflation_rate : float
+    inflation_rate : float or array-like
         Expected inflation rate as a decimal (e.g., 0.02 for 2%).
 
     Returns
     -------
-    float
-        Approximate real interest rate as a decimal.
+    float or numpy.ndarray
+        Approximate real interest rate as a decimal, broadcast over the inputs.
 
     Examples
     --------
     >>> fisher_real_rate(0.05, 0.02)
     0.030000...
+    >>> fisher_real_rate([0.05, 0.04], 0.02)
+    array([0.03, 0.02])
     """
-    return nominal_rate - inflation_rate
+    return _as_rate(nominal_rate) - _as_rate(inflation_rate)
 
 
-def fisher_exact_real_rate(nominal_rate: float, inflation_rate: float) -> float:
+def fisher_exact_real_rate(
+    nominal_rate: float | np.ndarray, inflation_rate: float | np.ndarray
+) -> float | np.ndarray:
     """
     Compute the real interest rate using the exact Fisher equation.
 
@@ -49,19 +68,25 @@ def fisher_exact_real_rate(nominal_rate: float, inflation_rate: float) -> float:
 
     Parameters
     ----------
-    nominal_rate : float
+    nominal_rate : float or array-like
         Nominal interest rate as a decimal.
-    inflation_rate : float
+    inflation_rate : float or array-like
         Expected inflation rate as a decimal.
 
     Returns
     -------
-    float
-        Exact real interest rate as a decimal.
+    float or numpy.ndarray
+        Exact real interest rate as a decimal, broadcast over the inputs.
 
     Examples
     --------
     >>> round(fisher_exact_real_rate(0.05, 0.02), 6)
     0.029412
+    >>> fisher_exact_real_rate([[0.05], [0.04]], [0.02, 0.03]).round(6)
+    array([[0.029412, 0.019417],
+           [0.019608, 0.009709]])
     """
-    return (1 + nominal_rate) / (1 + inflation_rate) - 1
+    nominal_rate = _as_rate(nominal_rate)
+    inflation_rate = _as_rate(inflation_rate)
+    # (1 + n) / (1 + i) - 1 rewritten exactly: no cancellation when n is close to i
+    return (nominal_rate - inflation_rate) / (1 + inflation_rate)
@@ -52,7 +52,7 @@ ValueError: Unknown or unsupported yield calculation convention: Unknown
 >>> curve_bey.discount_date("2021-01-01")
 0.9518143961927424
 >>> curve_bey.get_rate(1, yield_calculation_convention="Annual")
-np.float64(0.050624...)
+np.float64(0.050625...)
 >>> curve_bey.get_rate(1, yield_calculation_convention="BEY")
 0.05
 >>> curve_bey.get_rate(1, yield_calculation_convention="Continuous")
@@ -811,7 +811,7 @@ class FlatCurveBEY(YieldCurvePlotMixin, YieldCurveBase):
         >>> curve.get_rate(1)
         0.05
         >>> curve.get_rate(1, yield_calculation_convention="Annual")
-        np.float64(0.050624...)
+        np.float64(0.050625...)
         >>> curve.get_rate(1, yield_calculation_convention="BEY")
         0.05
         >>> curve.get_rate(1, yield_calculation_convention="Continuous")
@@ -863,7 +863,7 @@ class FlatCurveBEY(YieldCurvePlotMixin, YieldCurveBase):
         >>> curve.date_rate("2022-01-01")
         0.05
         >>> curve.date_rate("2022-01-01", yield_calculation_convention="Annual")
-        np.float64(0.050624...)
+        np.float64(0.050625...)
         >>> curve.date_rate("2022-01-01", yield_calculation_convention="BEY")
         0.05
         >>> curve.date_rate("2022-01-01", yield_calculation_convention="Continuous")
@@ -5,6 +5,8 @@ Each function is tested in a separate class using pytest.
 """
 
 import numpy as np
+import pytest
+
 from pyfian.time_value import interest_income
 
 
@@ -22,6 +24,11 @@ class TestInterestIncomeContinuous:
 
 
 class TestInterestIncomeEffective:
+    def test_small_rate_precision(self):
+        # (1 + r)**t - 1 loses most digits here; expm1/log1p keeps them
+        result = interest_income.interest_income_effective(1e-12, 1)
+        assert abs(result - 1e-12) < 1e-24
+
     def test_basic(self):
         assert np.isclose(interest_income.interest_income_effective(0.05, 1), 0.05)
 
@@ -112,3 +119,23 @@ class TestInterestIncomeBEY:
         assert np.isclose(
             interest_income.interest_income_bey(0.06, 2, notional=1000), 60.0
         )
+
+
+class TestInterestIncomeArrays:
+    @pytest.mark.parametrize(
+        "func, args",
+        [
+            (interest_income.interest_income_continuous, (1.5,)),
+            (interest_income.interest_income_effective, (1.5,)),
+            (interest_income.interest_income_nominal_periods, (12, 6)),
+            (interest_income.interest_income_nominal_days, (30, 360)),
+            (interest_income.interest_income_money_market_discount, (180,)),
+            (interest_income.interest_income_money_market_addon_notional, (180,)),
+            (interest_income.interest_income_money_market_addon_investment, (180,)),
+            (interest_income.interest_income_bey, (2,)),
+        ],
+    )
+    def test_matches_scalar(self, func, args):
+        rates = np.array([0.0, 0.01, 0.05, 0.12])
+        expected = [func(r, *args, notional=100) for r in rates]
+        assert np.allclose(func(rates, *args, notional=100), expected)
@@ -6,10 +6,19 @@ Unit tests for irr.py functions: npv, irr, and np_irr.
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from pyfian.time_value.irr import irr, np_irr, npv, xirr, xirr_dates
+from pyfian.time_value.irr import (
+    irr,
+    irr_batch,
+    np_irr,
+    npv,
+    xirr,
+    xirr_base,
+    xirr_dates,
+)
 
 
 class TestNPV:
@@ -30,12 +39,56 @@ class TestIRR:
         result = irr([-1000, 300, 400, 500, 600])
         assert abs(result - 0.2488833566240709) < 1e-8
 
+    def test_bond_cash_flows(self):
+        # 30-period bond bought at par yields its coupon rate
+        cash_flows = [-100] + [5] * 29 + [105]
+        assert abs(irr(cash_flows) - 0.05) < 1e-10
+
+    @pytest.mark.parametrize(
+        "cash_flows",
+        [
+            [-90] + [5] * 29 + [105],
+            [-200] + [5] * 9 + [105],
+            [-1e6, 1, 1, 2],
+            [-1, 1, 1, 1e6],
+        ],
+    )
+    def test_bullet_matches_polynomial_roots(self, cash_flows):
+        assert abs(irr(cash_flows) - np_irr(cash_flows)) < 1e-10
+
+    def test_long_bond_bracket_does_not_overflow(self):
+        # Widening the bracket below the approximate yield must not hit
+        # (1 + r)**-n overflow on a 2000-period series
+        # Coupon 1 on face 1 priced at 50: the yield is 2% up to a 1.02**-2000 term
+        cash_flows = [-50] + [1] * 1999 + [2]
+        assert irr(cash_flows) == pytest.approx(0.02, abs=1e-10)
+
+    def test_far_guess(self):
+        result = irr([-1000, 300, 400, 500, 600], guess=3.0)
+        assert abs(result - 0.2488833566240709) < 1e-8
+
     def test_convergence_fail(self):
         # Should raise ValueError for all positive cash flows (no IRR)
         with pytest.raises(ValueError):
             irr([100, 200, 300])
 
 
+class TestIRRBatch:
+    def test_matches_irr(self):
+        cash_flows = [
+            [-1000, 300, 400, 500, 600],
+            [-100, 5, 5, 5, 105],
+            [-50, 0, 60, 0, 0],
+        ]
+        result = irr_batch(cash_flows)
+        assert np.allclose(result, [irr(cf) for cf in cash_flows], atol=1e-10)
+
+    def test_non_convergent_row_is_nan(self):
+        result = irr_batch([[100, 200, 300], [-100, 110, 0]])
+        assert np.isnan(result[0])
+        assert abs(result[1] - 0.1) < 1e-10
+
+
 class TestNumpyIRR:
     def test_basic(self):
         # Example from docstring
@@ -48,6 +101,20 @@ class TestNumpyIRR:
         result = np_irr(cash_flows)
         assert isinstance(result, float)
 
+    @pytest.mark.parametrize(
+        "cash_flows,expected",
+        [
+            ([-100, 230, -132], 0.10),  # roots 10% and 20%
+            ([100, -215, 114], -0.05),  # roots -5% and 20%
+        ],
+    )
+    def test_multiple_roots_returns_smallest_in_magnitude(self, cash_flows, expected):
+        assert np_irr(cash_flows) == pytest.approx(expected, abs=1e-12)
+
+    def test_no_solution(self):
+        # All positive cash flows have no IRR
+        assert np.isnan(np_irr([100, 200, 300]))
+
 
 class TestIRRvsNumpyIRR:
     def test_compare(self):
@@ -102,6 +169,47 @@ class TestXIRR:
         result = xirr(cf, dates)
         assert abs(result - 0.5831820341312749) < 1e-3
 
+    def test_xirr_floors_times_of_day(self):
+        # Whole days elapsed, as timedelta.days counts them: a later time of
+        # day on the first date shortens every interval by one day
+        cf = [-1000, 300, 400, 500, 600]
+        dates = [
+            datetime(2020, 1, 1, 18),
+            datetime(2020, 6, 1, 6),
+            datetime(2021, 1, 1, 6),
+            datetime(2021, 6, 1, 6),
+            datetime(2022, 1, 1, 6),
+        ]
+        times = [(d - dates[0]).days / 365.0 for d in dates]
+        assert abs(xirr(cf, dates) - xirr_base(cf, times)) < 1e-10
+        assert abs(xirr(pd.Series(cf, index=dates)) - xirr_base(cf, times)) < 1e-10
+
+    @pytest.mark.filterwarnings("error")
+    def test_xirr_timezone_aware_dates(self):
+        cf = [-1000, 300, 400, 500, 600]
+        naive = ["2020-01-01", "2020-06-01", "2021-01-01", "2021-06-01", "2022-01-01"]
+        aware = pd.to_datetime(naive).tz_localize("UTC")
+        expected = xirr(cf, naive)
+        assert abs(xirr(cf, list(aware.to_pydatetime())) - expected) < 1e-10
+        assert abs(xirr(cf, list(aware)) - expected) < 1e-10
+        assert abs(xirr(pd.Series(cf, index=aware)) - expected) < 1e-10
+
+    def test_xirr_base_far_guess(self):
+        # The secant method diverges from this guess; the bracketed solver does not
+        result = xirr_base([-100, 110], [0, 1], guess=50)
+        assert abs(result - 0.1) < 1e-10
+
+    def test_xirr_non_iso_date_strings(self):
+        cf = [-1000, 300, 400, 500, 600]
+        dates = ["01/01/2020", "06/01/2020", "01/01/2021", "06/01/2021", "01/01/2022"]
+        result = xirr(cf, dates)
+        assert abs(result - 0.5831820341312749) < 1e-3
+
+    def test_xirr_base_root_outside_bracket_grid(self):
+        # The root (9900%) lies beyond the scanned rates, so Newton is used
+        result = xirr_base([-1, 100], [0, 1])
+        assert abs(result - 99.0) < 1e-8
+
     def test_xirr_invalid_inputs(self):
         with pytest.raises(ValueError):
             xirr([-1000], [datetime(2020, 1, 1)])
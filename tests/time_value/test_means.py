@@ -11,6 +11,14 @@ from pyfian.time_value.means import (
 )
 
 
+@pytest.mark.parametrize("mean", [geometric_mean, arithmetic_mean, harmonic_mean])
+def test_series_ignores_axis(mean):
+    series = pd.Series([0.03, 0.04, np.nan, 0.02])
+    result = mean(series, axis=1)
+    assert np.isscalar(result)
+    assert result == mean(series)
+
+
 class TestGeometricMean:
     def test_geometric_mean_numpy_1d(self):
         data = np.array([0.05, 0.1, -0.02])
@@ -22,6 +30,7 @@ class TestGeometricMean:
         series = pd.Series([0.03, 0.04, np.nan, 0.02])
         result = geometric_mean(series)
         expected = np.exp(np.nanmean(np.log(1 + series))) - 1
+        assert np.isscalar(result)
         assert np.isclose(result, expected)
 
     def test_geometric_mean_pandas_dataframe_axis0(self):
@@ -35,12 +44,23 @@ class TestGeometricMean:
         )
         pd.testing.assert_series_equal(result, expected)
 
+    def test_geometric_mean_dataframe_axis_none(self):
+        df = pd.DataFrame({"A": [0.01, 0.02], "B": [0.04, np.nan]})
+        result = geometric_mean(df, axis=None)
+        expected = np.expm1(np.log1p([0.01, 0.02, 0.04]).mean())
+        assert np.isscalar(result)
+        assert np.isclose(result, expected)
+
     def test_geometric_mean_with_nan(self):
         data = np.array([0.02, np.nan, 0.03])
         result = geometric_mean(data)
         expected = np.exp(np.nanmean(np.log(1 + data))) - 1
         assert np.isclose(result, expected)
 
+    def test_geometric_mean_small_returns_precision(self):
+        data = np.full(4, 1e-12)
+        assert geometric_mean(data) == pytest.approx(1e-12, rel=1e-12)
+
     def test_geometric_mean_invalid_input(self):
         with pytest.raises(ValueError):
             geometric_mean([0.05, -1.0, 0.02])
@@ -99,6 +119,16 @@ class TestWeightedGeometricMean:
         result = weighted_geometric_mean(returns, weights)
         assert np.isclose(result, expected)
 
+    def test_weighted_geometric_mean_2d_axis(self):
+        returns = np.array([[0.05, 0.01], [np.nan, 0.03], [0.02, -0.01]])
+        weights = np.array([[1.0, 1.0], [2.0, np.nan], [1.0, 3.0]])
+        result = weighted_geometric_mean(returns, weights, axis=0)
+        expected = [
+            weighted_geometric_mean(returns[:, 0], weights[:, 0]),
+            weighted_geometric_mean(returns[:, 1], weights[:, 1]),
+        ]
+        np.testing.assert_allclose(result, expected)
+
     def test_weighted_geometric_mean_invalid(self):
         returns = np.array([0.05, -1.0, 0.02])
         weights = np.array([1, 2, 1])
@@ -122,6 +152,22 @@ class TestWeightedHarmonicMean:
         result = weighted_harmonic_mean(values, weights)
         assert np.isclose(result, expected)
 
+    def test_weighted_harmonic_mean_skips_value_with_nan_weight(self):
+        values = np.array([15, -20, 25])
+        weights = np.array([100, np.nan, 700])
+        expected = 800 / (100 / 15 + 700 / 25)
+        assert np.isclose(weighted_harmonic_mean(values, weights), expected)
+
+    def test_weighted_harmonic_mean_2d_axis(self):
+        values = np.array([[15.0, 10.0], [20.0, np.nan], [25.0, 30.0]])
+        weights = np.array([[100.0, 1.0], [200.0, 2.0], [700.0, 3.0]])
+        result = weighted_harmonic_mean(values, weights, axis=0)
+        expected = [
+            weighted_harmonic_mean(values[:, 0], weights[:, 0]),
+            weighted_harmonic_mean(values[:, 1], weights[:, 1]),
+        ]
+        np.testing.assert_allclose(result, expected)
+
     def test_weighted_harmonic_mean_with_zero(self):
         values = np.array([15, 0, 25])
         weights = np.array([100, 200, 700])
@@ -155,3 +201,23 @@ class TestHarmonicMean:
         )
         result = harmonic_mean(df)
         pd.testing.assert_series_equal(result, expected)
+
+    def test_harmonic_mean_2d_array_axis(self):
+        data = np.array([[10.0, 5.0], [20.0, np.nan], [30.0, 15.0]])
+        result = harmonic_mean(data, axis=0)
+        expected = [3 / np.sum(1 / data[:, 0]), 2 / (1 / 5 + 1 / 15)]
+        np.testing.assert_allclose(result, expected)
+
+    def test_harmonic_mean_axis_none(self):
+        assert np.isclose(harmonic_mean([10, 20], axis=None), 2 / (1 / 10 + 1 / 20))
+        data = np.array([[10.0, 5.0], [20.0, np.nan]])
+        assert np.isclose(harmonic_mean(data, axis=None), 3 / (1 / 10 + 1 / 5 + 1 / 20))
+
+    def test_harmonic_mean_1d_ignores_axis(self):
+        assert harmonic_mean([10, 20], axis=1) == harmonic_mean([10, 20])
+
+    def test_harmonic_mean_dataframe_axis1(self):
+        df = pd.DataFrame({"A": [10, 20], "B": [5, 10]}, index=["x", "y"])
+        result = harmonic_mean(df, axis=1)
+        expected = pd.Series({"x": 2 / (1 / 10 + 1 / 5), "y": 2 / (1 / 20 + 1 / 10)})
+        pd.testing.assert_series_equal(result, expected)
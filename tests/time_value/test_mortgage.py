@@ -1,9 +1,16 @@
 import re
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from pyfian.time_value.mortgage import calculate_payment, mortgage_cash_flows
+from pyfian.time_value.mortgage import (
+    amortization_balances,
+    calculate_payment,
+    calculate_payments,
+    generate_amortization_schedule,
+    mortgage_cash_flows,
+)
 
 
 class TestMortgageCashFlows:
@@ -88,6 +95,31 @@ class TestMortgageCashFlows:
             )
 
 
+class TestGenerateAmortizationSchedule:
+    def test_matches_recurrence(self):
+        principal, annual_rate, term_months, interval = 200000, 0.04, 360, 1
+        df = generate_amortization_schedule(
+            principal, annual_rate, term_months, interval
+        )
+        payment = calculate_payment(principal, annual_rate, term_months, interval)
+        balance = principal
+        interest, balances = [], []
+        for _ in range(term_months):
+            interest.append(balance * annual_rate / 12)
+            balance -= payment - interest[-1]
+            balances.append(max(balance, 0))
+        assert list(df["Period"]) == list(range(1, term_months + 1))
+        assert np.allclose(df["Interest"], interest, atol=0.005)
+        assert np.allclose(df["Remaining Balance"], balances, atol=0.005)
+
+    def test_first_rows(self):
+        df = generate_amortization_schedule(200000, 0.04, 360, 1)
+        assert df["Payment"].iloc[0] == 954.83
+        assert list(df["Interest"].iloc[:2]) == [666.67, 665.71]
+        assert list(df["Principal"].iloc[:2]) == [288.16, 289.12]
+        assert list(df["Remaining Balance"].iloc[:2]) == [199711.84, 199422.71]
+
+
 class TestCalculatePayment:
     def test_calculate_payment_zero_interval(self):
         with pytest.raises(
@@ -95,6 +127,57 @@ class TestCalculatePayment:
         ):
             calculate_payment(100000, 0.05, 360, 0)
 
+    def test_calculate_payment_accepts_array_and_series_principals(self):
+        expected = [calculate_payment(p, 0.05, 12) for p in (1000.0, 2000.0)]
+        result = calculate_payment(np.array([1000.0, 2000.0]), 0.05, 12)
+        np.testing.assert_allclose(result, expected, rtol=1e-15)
+        series = calculate_payment(
+            pd.Series([1000.0, 2000.0], index=["a", "b"]), 0.05, 12
+        )
+        assert isinstance(series, pd.Series)
+        np.testing.assert_allclose(series.to_numpy(), expected, rtol=1e-15)
+
+
+class TestCalculatePayments:
+    def test_matches_scalar(self):
+        principals = np.array([200000, 100000, 50000, 75000])
+        rates = np.array([0.04, 0.05, 0.0, 0.07])
+        terms = np.array([360, 180, 120, 240])
+        intervals = np.array([1, 3, 1, 6])
+        expected = [
+            calculate_payment(*args)
+            for args in zip(principals, rates, terms, intervals)
+        ]
+        result = calculate_payments(principals, rates, terms, intervals)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_broadcasts_scalar_terms(self):
+        result = calculate_payments([100000, 200000], 0.05, 360)
+        np.testing.assert_allclose(
+            result,
+            [
+                calculate_payment(100000, 0.05, 360),
+                calculate_payment(200000, 0.05, 360),
+            ],
+        )
+
+    @pytest.mark.parametrize("term, interval", [(360, 0), (2, 3)])
+    def test_invalid_schedule(self, term, interval):
+        with pytest.raises(ValueError):
+            calculate_payments([100000], [0.05], term, interval)
+
+
+class TestAmortizationBalances:
+    def test_rows_match_schedules(self):
+        loans = [(200000, 0.04, 360, 1), (50000, 0.0, 120, 3), (75000, 0.07, 60, 1)]
+        principals, rates, terms, intervals = map(np.array, zip(*loans))
+        result = amortization_balances(principals, rates, terms, intervals)
+        assert result.shape == (3, 360)
+        for row, loan in zip(result, loans):
+            expected = generate_amortization_schedule(*loan)["Remaining Balance"]
+            np.testing.assert_allclose(row[: len(expected)].round(2), expected)
+            assert np.isnan(row[len(expected) :]).all()
+
 
 # if __name__ == "__main__":
 #     test = TestMortgageCashFlows()
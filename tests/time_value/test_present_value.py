@@ -1,10 +1,15 @@
+import numpy as np
 import pytest
 
 from pyfian.time_value.present_value import (
+    _annuity_factors,
     present_value_annuity,
     present_value_annuity_annual,
+    present_value_annuity_batch,
     present_value_growing_annuity,
+    present_value_growing_perpetuity_batch,
     present_value_two_stage_annuity,
+    present_value_two_stage_annuity_batch,
 )
 
 
@@ -28,6 +33,36 @@ class TestPresentValueAnnuity:
             == expected
         )
 
+    def test_annuity_array_rates_dispatch_to_batch(self):
+        rates = np.array([0.0, 0.05])
+        result = present_value_annuity(100, rates, 10)
+        np.testing.assert_allclose(result, present_value_annuity_batch(100, rates, 10))
+
+
+class TestPresentValueAnnuityBatch:
+    def test_matches_scalar(self):
+        rates = np.array([0.0, 0.01, 0.05, 0.12])
+        periods = np.array([[5], [30]])
+        result = present_value_annuity_batch(250, rates, periods)
+        expected = [
+            [present_value_annuity(250, r, int(n)) for r in rates]
+            for n in periods[:, 0]
+        ]
+        assert result.shape == (2, 4)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+class TestAnnuityFactors:
+    def test_factors(self):
+        annuity, discount = _annuity_factors(0.05, 10)
+        assert annuity == pytest.approx((1 - 1.05**-10) / 0.05, rel=1e-12)
+        assert discount == pytest.approx(1.05**-10, rel=1e-12)
+
+    def test_array_arguments_use_batch(self):
+        annuity, discount = _annuity_factors(0.05, np.array([5, 10]))
+        np.testing.assert_allclose(annuity, [(1 - 1.05**-n) / 0.05 for n in (5, 10)])
+        np.testing.assert_allclose(discount, [1.05**-5, 1.05**-10])
+
 
 class TestPresentValueGrowingAnnuity:
     def test_growing_annuity(self):
@@ -64,6 +99,12 @@ class TestPresentValueGrowingAnnuity:
             == expected
         )
 
+    @pytest.mark.parametrize("gap", [1e-15, 1e-12, 1e-9, -1e-9])
+    def test_growing_annuity_near_equal_rates(self, gap):
+        # The limit rate == growth must be approached smoothly
+        result = present_value_growing_annuity(100, 0.07, 10, 0.07 + gap)
+        assert result == pytest.approx(1000, rel=1e-8)
+
 
 class TestPresentValueTwoStageAnnuity:
     def test_two_stage_annuity(self):
@@ -87,6 +128,35 @@ class TestPresentValueTwoStageAnnuity:
             == expected
         )
 
+    def test_array_periods(self):
+        result = present_value_two_stage_annuity(100, 0.05, 0.06, np.array([5, 10]), 5)
+        np.testing.assert_allclose(result, [762.99739193, 1030.77608859])
+        result = present_value_two_stage_annuity(100, 0.05, 0.06, 5, np.array([5, 10]))
+        expected = [
+            present_value_two_stage_annuity(100, 0.05, 0.06, 5, n) for n in (5, 10)
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_float32_rates_stay_float32(self):
+        rates = np.array([0.0, 0.01, 0.05], dtype=np.float32)
+        result = present_value_annuity_batch(np.float32(100), rates, 20)
+        assert result.dtype == np.float32
+        expected = present_value_annuity_batch(100, rates.astype(np.float64), 20)
+        np.testing.assert_allclose(result, expected, rtol=1e-5)
+
+
+class TestPresentValueTwoStageAnnuityBatch:
+    def test_grid_matches_scalar(self):
+        rate1 = np.array([[0.0], [0.03], [0.08]])
+        rate2 = np.array([0.0, 0.05, 0.1])
+        result = present_value_two_stage_annuity_batch(100, rate1, rate2, 4, 6)
+        expected = [
+            [present_value_two_stage_annuity(100, r1, r2, 4, 6) for r2 in rate2]
+            for r1 in rate1[:, 0]
+        ]
+        assert result.shape == (3, 3)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
 
 class TestPresentValueGrowingPerpetuity:
     def test_growing_perpetuity_growth_gt_rate(self):
@@ -101,6 +171,19 @@ class TestPresentValueGrowingPerpetuity:
             present_value_growing_perpetuity(payment, rate, growth)
 
 
+class TestPresentValueGrowingPerpetuityBatch:
+    def test_matches_scalar_and_masks_invalid(self):
+        from pyfian.time_value.present_value import present_value_growing_perpetuity
+
+        rates = np.array([0.05, 0.08, 0.02, 0.01])
+        result = present_value_growing_perpetuity_batch(100, rates, 0.02)
+        np.testing.assert_allclose(
+            result[:2],
+            [present_value_growing_perpetuity(100, r, 0.02) for r in rates[:2]],
+        )
+        assert np.isnan(result[2:]).all()
+
+
 class TestPresentValueTwoStageAnnuityPerpetuity:
     def test_two_stage_annuity_perpetuity_level(self):
         from pyfian.time_value.present_value import (
@@ -154,6 +237,20 @@ class TestPresentValueTwoStageAnnuityPerpetuity:
         )
         assert pytest.approx(result, rel=1e-9) == expected
 
+    def test_two_stage_annuity_perpetuity_array_periods(self):
+        from pyfian.time_value.present_value import (
+            present_value_two_stage_annuity_perpetuity,
+        )
+
+        result = present_value_two_stage_annuity_perpetuity(
+            100, 0.05, np.array([5, 10]), 0.06, 0.02, 0.01
+        )
+        expected = [
+            present_value_two_stage_annuity_perpetuity(100, 0.05, n, 0.06, 0.02, 0.01)
+            for n in (5, 10)
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
     def test_two_stage_annuity_perpetuity_growth_gt_rate(self):
         from pyfian.time_value.present_value import (
             present_value_two_stage_annuity_perpetuity,
@@ -1,6 +1,9 @@
 import re
-import pytest
+from enum import IntEnum
+
 import numpy as np
+import pandas as pd
+import pytest
 
 from pyfian.time_value import rate_conversions as rc
 
@@ -77,12 +80,133 @@ class TestRateConversions:
             rc.effective_to_money_market_rate(ear_disc, days, base, discount=True), mmr
         )
 
+    def test_money_market_discount_small_rate_round_trip(self):
+        mmr = np.array([1e-10, 0.002, 0.05])
+        ear = rc.money_market_rate_to_effective(mmr, 90, 360, discount=True)
+        back = rc.effective_to_money_market_rate(ear, 90, 360, discount=True)
+        np.testing.assert_allclose(back, mmr, rtol=1e-12)
+
     def test_bey_to_effective_annual_and_inverse(self):
         bey = 0.06
         ear = rc.bey_to_effective_annual(bey)
         assert np.isclose(ear, 0.0609, atol=1e-4)
         assert np.isclose(rc.effective_annual_to_bey(ear), bey, atol=1e-4)
 
+    def test_bey_round_trip_small_and_array_rates(self):
+        bey = np.array([1e-12, 0.001, 0.06])
+        ear = rc.bey_to_effective_annual(bey)
+        np.testing.assert_allclose(ear, bey + bey**2 / 4, rtol=1e-15)
+        np.testing.assert_allclose(rc.effective_annual_to_bey(ear), bey, rtol=1e-14)
+        assert rc.effective_annual_to_bey(1e-12) == pytest.approx(1e-12, rel=1e-14)
+
+    @pytest.mark.parametrize(
+        "rate",
+        [np.float32(0.06), np.int64(0), pd.Series([0.05, 0.06])],
+        ids=["float32", "int64", "series"],
+    )
+    def test_bey_conversions_accept_numpy_scalars_and_series(self, rate):
+        expected = np.asarray(rate, dtype=float)
+        ear = rc.bey_to_effective_annual(rate)
+        bey = rc.effective_annual_to_bey(ear)
+        np.testing.assert_allclose(
+            np.asarray(ear, dtype=float), expected * (1 + expected / 4), rtol=1e-6
+        )
+        np.testing.assert_allclose(np.asarray(bey, dtype=float), expected, atol=1e-7)
+        if isinstance(rate, pd.Series):
+            assert isinstance(ear, pd.Series) and isinstance(bey, pd.Series)
+
+    def test_compounding_keeps_precision_for_small_rates(self):
+        rates = np.array([1e-12, 1e-8, 1e-6])
+        n = 365
+        exact = rates + rates**2 * (n - 1) / (2 * n)
+        np.testing.assert_allclose(
+            rc.nominal_periods_to_effective(rates, n), exact, rtol=1e-12
+        )
+        assert rc.nominal_periods_to_effective(1e-12, n) == pytest.approx(
+            1e-12, rel=1e-12
+        )
+        np.testing.assert_allclose(
+            rc.effective_to_nominal_periods(exact, n), rates, rtol=1e-12
+        )
+
+    def test_array_conversions_leave_input_untouched(self):
+        rates = np.array([0.0, 0.05, 0.12])
+        ear = rc.nominal_periods_to_effective(rates, 12)
+        np.testing.assert_array_equal(rates, [0.0, 0.05, 0.12])
+        np.testing.assert_allclose(ear, (1 + rates / 12) ** 12 - 1, rtol=1e-14)
+        np.testing.assert_allclose(
+            rc.effective_to_nominal_periods(ear, 12), rates, atol=1e-15
+        )
+        np.testing.assert_allclose(
+            rc.single_period_to_effective(np.array([0, 1]), 2), [0.0, 3.0]
+        )
+
+    @pytest.mark.parametrize(
+        "convert",
+        [
+            rc.continuous_to_effective,
+            rc.effective_to_continuous,
+            lambda r: rc.nominal_periods_to_effective(r, 12),
+            lambda r: rc.effective_to_nominal_days(r, 30, 365),
+            lambda r: rc.money_market_rate_to_effective(r, 90, discount=True),
+            lambda r: rc.effective_to_money_market_rate(r, 90),
+            rc.bey_to_effective_annual,
+            rc.effective_annual_to_bey,
+            lambda r: rc.convert_yield(r, "BEY", "Continuous"),
+        ],
+    )
+    def test_float32_arrays_stay_float32(self, convert):
+        rates = np.array([0.001, 0.05, 0.12])
+        result = convert(rates.astype(np.float32))
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, convert(rates), rtol=0, atol=1e-6)
+
+    @pytest.mark.parametrize(
+        "convert",
+        [
+            rc.nominal_periods_to_effective,
+            rc.effective_to_nominal_periods,
+            rc.single_period_to_effective,
+            rc.effective_to_single_period,
+            rc.nominal_days_to_effective,
+            rc.effective_to_nominal_days,
+            rc.money_market_rate_to_effective,
+            rc.effective_to_money_market_rate,
+            lambda r, n: rc.money_market_rate_to_effective(r, n, discount=True),
+            lambda r, n: rc.effective_to_money_market_rate(r, n, discount=True),
+        ],
+    )
+    def test_array_periods_broadcast_against_rates(self, convert):
+        rates = np.array([[0.01], [0.05]])
+        periods = np.array([1, 2, 4, 12, 90, 180])
+        result = convert(rates, periods)
+        assert result.shape == (2, 6)
+        expected = [[convert(r, int(n)) for n in periods] for r in (0.01, 0.05)]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        np.testing.assert_allclose(convert(0.05, periods), expected[1], rtol=1e-12)
+
+    def test_array_periods_validation(self):
+        with pytest.raises(ValueError):
+            rc.nominal_periods_to_effective(0.05, np.array([12, 0]))
+        with pytest.raises(ValueError):
+            rc.single_period_to_effective(0.01, np.array([-1.0]))
+        with pytest.raises(TypeError):
+            rc.nominal_days_to_effective(0.05, np.array([True]))
+
+    def test_periods_accept_int_subclasses_and_nan(self):
+        class Frequency(IntEnum):
+            MONTHLY = 12
+
+        assert rc.nominal_periods_to_effective(0.05, Frequency.MONTHLY) == (
+            pytest.approx(rc.nominal_periods_to_effective(0.05, 12), rel=1e-15)
+        )
+        with pytest.raises(ValueError):
+            rc.effective_to_nominal_periods(0.05, IntEnum("Bad", {"ZERO": 0}).ZERO)
+        assert np.isnan(rc.nominal_days_to_effective(0.05, float("nan"), 360))
+        assert np.isnan(
+            rc.nominal_days_to_effective(0.05, np.array([30.0, np.nan]), 360)[1]
+        )
+
     def test_input_validation(self):
         with pytest.raises(TypeError):
             rc.continuous_to_effective("bad")
@@ -97,6 +221,46 @@ class TestRateConversions:
         with pytest.raises(ValueError):
             rc.nominal_days_to_effective(0.01, -1)
 
+    def test_input_validation_scalar_types(self):
+        with pytest.raises(ValueError):
+            rc.effective_to_continuous(np.float64(-1.0))
+        with pytest.raises(ValueError):
+            rc.effective_to_continuous(np.array([0.05, -1.5]))
+        with pytest.raises(TypeError):
+            rc.effective_to_nominal_periods(0.05, True)
+        with pytest.raises(ValueError):
+            rc.effective_to_nominal_periods(0.05, 0.0)
+
+    @pytest.mark.parametrize(
+        "convert",
+        [
+            lambda r: rc.nominal_periods_to_effective(r, 12),
+            lambda r: rc.nominal_days_to_effective(r, 30, 360),
+            lambda r: rc.single_period_to_effective(r / 12, 12),
+            lambda r: rc.money_market_rate_to_effective(r, 30),
+            lambda r: rc.convert_yield(r, "BEY-M", "Continuous"),
+        ],
+    )
+    def test_rate_per_period_at_or_below_minus_one(self, convert):
+        # Scalars raise a descriptive error; array entries become NaN instead
+        for rate in (-12.0, -24.0):
+            with pytest.raises(ValueError, match="greater than -1"):
+                convert(rate)
+        with np.errstate(invalid="ignore"):
+            assert np.isnan(convert(np.array([0.05, -24.0]))[1])
+
+    def test_money_market_discount_at_or_above_face(self):
+        for mmr in (12.0, 15.0):
+            with pytest.raises(ValueError, match="less than 1 for a discount rate"):
+                rc.money_market_rate_to_effective(mmr, 30, discount=True)
+        with pytest.raises(ValueError, match="less than 1 for a discount rate"):
+            rc.money_market_rate_to_effective(5, 90, 365, discount=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = rc.money_market_rate_to_effective(
+                np.array([0.05, 5.0]), 90, 365, discount=True
+            )
+        assert np.isnan(result[1])
+
 
 # Separate class for convert_yield tests
 class TestConvertYield:
@@ -120,6 +284,37 @@ class TestConvertYield:
             f"Failed: {rate}, {from_conv} -> {to_conv}, Expected: {expected}, Got: {result}"
         )
 
+    def test_convert_yield_scalar_results_are_memoized(self):
+        rc._convert_yield_cached.cache_clear()
+        first = rc.convert_yield(0.0437, "BEY", "Continuous")
+        second = rc.convert_yield(0.0437, "BEY", "Continuous")
+        assert first == second
+        assert rc._convert_yield_cached.cache_info().hits == 1
+
+    def test_convert_yield_array_matches_scalar(self):
+        rates = [0.01, 0.03, 0.05, 0.08]
+        for from_conv, to_conv in [("BEY", "Continuous"), ("BEY-M", "BEY-Q")]:
+            result = rc.convert_yield(rates, from_conv, to_conv)
+            assert isinstance(result, np.ndarray)
+            np.testing.assert_allclose(
+                result, [rc.convert_yield(r, from_conv, to_conv) for r in rates]
+            )
+
+    @pytest.mark.parametrize("nominal", ["BEY", "BEY-Q", "BEY-M"])
+    def test_convert_yield_nominal_continuous_matches_via_effective(self, nominal):
+        rates = np.linspace(-0.5, 0.5, 101)
+        via_effective = rc.effective_to_continuous(
+            rc.convert_yield(rates, nominal, "Annual")
+        )
+        continuous = rc.convert_yield(rates, nominal, "Continuous")
+        np.testing.assert_allclose(continuous, via_effective, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(
+            rc.convert_yield(continuous, "Continuous", nominal), rates, atol=1e-15
+        )
+        assert rc.convert_yield(1e-12, nominal, "Continuous") == pytest.approx(
+            1e-12, rel=1e-12
+        )
+
     def test_convert_yield_invalid_convention(self):
         with pytest.raises(ValueError):
             rc.convert_yield(0.05, "BAD", "Annual")
@@ -127,6 +322,31 @@ class TestConvertYield:
             rc.convert_yield(0.05, "Annual", "BAD")
 
 
+class TestConvertYieldBatch:
+    def test_mixed_conventions_match_convert_yield(self):
+        rates = np.array([0.05, 0.04, 0.03, 0.06, 0.02])
+        from_conv = ["BEY", "Continuous", "BEY-M", "Annual", "BEY"]
+        to_conv = ["Annual", "BEY", "Continuous", "Annual", "BEY-Q"]
+        result = rc.convert_yield_batch(rates, from_conv, to_conv)
+        expected = [
+            rc.convert_yield(float(r), f, t)
+            for r, f, t in zip(rates, from_conv, to_conv)
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-15)
+
+    def test_conventions_broadcast(self):
+        rates = [[0.05], [0.03]]
+        result = rc.convert_yield_batch(rates, "BEY", ["Annual", "Continuous"])
+        assert result.shape == (2, 2)
+        assert result[1, 1] == pytest.approx(
+            rc.convert_yield(0.03, "BEY", "Continuous")
+        )
+
+    def test_invalid_convention(self):
+        with pytest.raises(ValueError):
+            rc.convert_yield_batch([0.05, 0.04], ["BEY", "BAD"], "Annual")
+
+
 # test convert_effective_to_mmr function
 class TestConvertEffectiveToMMR:
     @pytest.mark.parametrize(
@@ -1,3 +1,6 @@
+from fractions import Fraction
+
+import numpy as np
 import pytest
 
 from pyfian.time_value.real_rates import fisher_exact_real_rate, fisher_real_rate
@@ -45,3 +48,24 @@ class TestFischerRate:
     def test_equal_nominal_and_inflation(self):
         assert pytest.approx(fisher_real_rate(0.03, 0.03), 0.0001) == 0.0
         assert pytest.approx(fisher_exact_real_rate(0.03, 0.03), 0.0001) == 0.0
+
+    def test_exact_rate_keeps_precision_for_close_rates(self):
+        nominal, inflation = 0.02, 0.019999
+        expected = float((1 + Fraction(nominal)) / (1 + Fraction(inflation)) - 1)
+        assert fisher_exact_real_rate(nominal, inflation) == pytest.approx(
+            expected, rel=1e-12
+        )
+
+    def test_rates_broadcast_over_arrays(self):
+        nominal = np.array([[0.01], [0.03], [0.05]])
+        inflation = [0.0, 0.02]
+        exact = fisher_exact_real_rate(nominal, inflation)
+        assert exact.shape == (3, 2)
+        expected = [
+            [fisher_exact_real_rate(float(n), i) for i in inflation]
+            for n in nominal[:, 0]
+        ]
+        np.testing.assert_allclose(exact, expected, rtol=1e-15)
+        np.testing.assert_allclose(
+            fisher_real_rate([0.05, 0.04], (0.02, 0.01)), [0.03, 0.03]
+        )